@@ -11,18 +11,30 @@ Copyright (c) 2026. All rights reserved.
 __version__ = "1.0.0"
 __author__ = "ARICCA-X Development Team"
 
-from .credibility_logic_engine import CredibilityLogicEngine
-from .venue_fingerprint_builder import VenueFingerprintBuilder
-from .compliance_compiler import ComplianceCompiler
-from .citation_graph_analyzer import CitationGraphAnalyzer
-from .risk_explanation_generator import RiskExplanationGenerator
-from .report_renderer import ReportRenderer
-
-__all__ = [
-    'CredibilityLogicEngine',
-    'VenueFingerprintBuilder',
-    'ComplianceCompiler',
-    'CitationGraphAnalyzer',
-    'RiskExplanationGenerator',
-    'ReportRenderer'
-]
+from importlib import import_module
+
+# Public classes and the modules that define them. Each is imported on
+# first access (PEP 562), so importing the package loads no subsystems.
+_LAZY_IMPORTS = {
+    'CredibilityLogicEngine': '.credibility_logic_engine.credibility_logic_engine',
+    'ComplianceCompiler': '.compliance_compiler.compliance_compiler',
+    'CitationGraphAnalyzer': '.citation_graph_analyzer.citation_graph_analyzer',
+    'RiskExplanationGenerator': '.risk_explanation_generator.risk_explanation_generator',
+    'ReportRenderer': '.report_renderer.report_renderer'
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    """Import a public class on first access and keep it as a module global"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,131 @@
+"""
+Common Helpers - Utilities shared by the ARICCA-X modules
+
+Implements the missing-data sentinel, cache keys, bounded caches and
+batch mapping used across modules.
+Copyright (c) 2026. All rights reserved.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+
+
+# Marks a score component missing from the assessment data, where None
+# could be a real value
+MISSING = object()
+
+# Immutable scalar types allowed in cache keys, tagged with their type so
+# that True, 1 and 1.0 stay distinct
+_KEY_SCALAR_TYPES = frozenset({int, float, bool, complex, bytes})
+
+
+def freeze(value: Any, _frozen: Optional[Dict[int, Hashable]] = None) -> Hashable:
+    """
+    Hashable snapshot of nested plain data for use as a cache key.
+    
+    Dict keys are frozen like values, so {1: x} and {True: x} differ.
+    Dicts keep insertion order (reordered data is merely a cache miss) and
+    each dict is frozen once even when it is shared, as venue dicts often
+    embed their own cfp/website/fingerprint data. Raises TypeError for
+    anything that is not plain immutable data.
+    """
+    kind = type(value)
+    if kind is str or value is None:
+        return value
+    if kind is dict:
+        if _frozen is None:
+            _frozen = {}
+        if id(value) not in _frozen:
+            _frozen[id(value)] = (dict, tuple([
+                (freeze(key, _frozen), freeze(item, _frozen))
+                for key, item in value.items()
+            ]))
+        return _frozen[id(value)]
+    if kind is list or kind is tuple:
+        return (kind, tuple([freeze(item, _frozen) for item in value]))
+    if kind in _KEY_SCALAR_TYPES:
+        return (kind, value)
+    raise TypeError(f"cannot use {kind.__name__} in a cache key")
+
+
+class LRUCache:
+    """
+    Bounded cache that evicts its least recently used entry.
+    
+    Each analyzer owns its cache, so entries are released along with it.
+    Caches pickle as empty, so analyzers sent to worker processes do not
+    carry their cached results along.
+    """
+    
+    __slots__ = ('maxsize', '_entries')
+    
+    def __init__(self, maxsize: int):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Number of entries to keep
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __reduce__(self):
+        return (LRUCache, (self.maxsize,))
+    
+    def get(self, key: Hashable) -> Any:
+        """Cached value for key, marked as recently used, or None"""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+    
+    def put(self, key: Hashable, value: Any):
+        """Cache a value, evicting the least recently used entry when full"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop every cached entry"""
+        self._entries.clear()
+
+
+def parallel_map(
+    fn: Callable,
+    items: Sequence,
+    *args: Any,
+    n_jobs: Optional[int] = None
+) -> List:
+    """
+    Apply fn(item, *args) to every item, in input order.
+    
+    Items are processed independently, so more than one requested worker
+    spreads them over that many processes (never more than there are
+    items); otherwise they run serially in this process. A few chunks per
+    worker keeps pickling overhead low while still balancing uneven items.
+    
+    Args:
+        fn: Function to apply; must be picklable for parallel runs
+        items: Items to process
+        args: Arguments passed unchanged after each item
+        n_jobs: Optional worker process count
+    
+    Returns:
+        fn's result for each item
+    """
+    workers = min(n_jobs or 1, len(items))
+    
+    if workers <= 1:
+        return [fn(item, *args) for item in items]
+    
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            fn, items, *[repeat(arg) for arg in args], chunksize=chunksize
+        ))
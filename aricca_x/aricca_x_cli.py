@@ -11,13 +11,13 @@ import sys
 import argparse
 from pathlib import Path
 from datetime import datetime
+from dataclasses import fields
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+# Add the package's parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from aricca_x import (
     CredibilityLogicEngine,
-    VenueFingerprintBuilder,
     ComplianceCompiler,
     CitationGraphAnalyzer,
     RiskExplanationGenerator,
@@ -35,7 +35,6 @@ class ARRICCAX:
     def __init__(self):
         """Initialize ARICCA-X system"""
         self.credibility_engine = CredibilityLogicEngine()
-        self.fingerprint_builder = VenueFingerprintBuilder()
         self.compliance_compiler = ComplianceCompiler()
         self.citation_analyzer = CitationGraphAnalyzer()
         self.risk_generator = RiskExplanationGenerator()
@@ -85,16 +84,18 @@ class ARRICCAX:
             website_data=website_data
         )
         
+        assessment_data = {f.name: getattr(assessment, f.name) for f in fields(assessment)}
+        
         # Generate explanation
         print("Generating risk explanation...")
         explanation = self.risk_generator.generate_explanation(
-            assessment.__dict__
+            assessment_data
         )
         
         # Render report
         print("Rendering report...\n")
         report = self.report_renderer.render_assessment_report(
-            assessment.__dict__,
+            assessment_data,
             output_format=output_format
         )
         
@@ -126,7 +127,7 @@ class ARRICCAX:
         # Render report
         print("Generating compliance report...\n")
         formatted_report = self.report_renderer.render_compliance_report(
-            report.__dict__,
+            {f.name: getattr(report, f.name) for f in fields(report)},
             output_format=output_format
         )
         
@@ -10,7 +10,7 @@ from typing import Dict, List, Set, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedCitation:
     """Represents a citation extracted from text"""
     reference_id: str
@@ -35,6 +35,9 @@ class CitationExtractor:
         r'\(([A-Z][a-z]+\s+and\s+[A-Z][a-z]+,\s*\d{4})\)',  # (Smith and Jones, 2020)
     ]
     
+    # Sentence boundaries, for splitting text around citations
+    SENTENCE_BREAK = re.compile(r'[.!?]+\s+')
+    
     # Context indicators for citation type
     SUPPORT_INDICATORS = ['shown', 'demonstrated', 'proven', 'validated', 'confirmed']
     CONTRAST_INDICATORS = ['however', 'contrary', 'unlike', 'different', 'contrast']
@@ -69,14 +72,15 @@ class CitationExtractor:
                 for match in pattern.finditer(sentence):
                     # Extract reference IDs
                     ref_ids = self._parse_reference_ids(match.group(1))
+                    if not ref_ids:
+                        continue
+                    
+                    # Context and type depend only on the sentence, so
+                    # every ID in the citation shares them
+                    context = self._extract_context(sentences, i, window=2)
+                    cit_type = self._classify_citation(sentence)
                     
                     for ref_id in ref_ids:
-                        # Extract context
-                        context = self._extract_context(sentences, i, window=2)
-                        
-                        # Determine citation type
-                        cit_type = self._classify_citation(sentence)
-                        
                         citations.append(ExtractedCitation(
                             reference_id=ref_id,
                             position=match.start(),
@@ -90,7 +94,7 @@ class CitationExtractor:
     def _split_sentences(self, text: str) -> List[str]:
         """Split text into sentences"""
         # Simple sentence splitting
-        sentences = re.split(r'[.!?]+\s+', text)
+        sentences = self.SENTENCE_BREAK.split(text)
         return [s.strip() for s in sentences if s.strip()]
     
     def _parse_reference_ids(self, ref_string: str) -> List[str]:
@@ -6,14 +6,15 @@ Copyright (c) 2026. All rights reserved.
 """
 
 from typing import Dict, List, Set, Tuple, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from .._common import LRUCache, freeze
 from .citation_extractor import CitationExtractor, ExtractedCitation
 from .graph_builder import GraphBuilder, CitationGraph
 from .pattern_detector import PatternDetector, CitationPattern
 
 
-@dataclass
+@dataclass(slots=True)
 class CitationAnalysisResult:
     """Complete citation analysis results"""
     manuscript_id: str
@@ -39,11 +40,21 @@ class CitationGraphAnalyzer:
     detection algorithms.
     """
     
-    def __init__(self):
-        """Initialize the citation graph analyzer"""
+    def __init__(self, cache_size: int = 0):
+        """
+        Initialize the citation graph analyzer.
+        
+        Args:
+            cache_size: Number of recent analyses to keep for manuscripts
+                that are analyzed again with identical text, references
+                and authors. Off by default, as most manuscripts are
+                analyzed once.
+        """
         self.extractor = CitationExtractor()
         self.graph_builder = GraphBuilder()
         self.pattern_detector = PatternDetector()
+        self.cache_size = cache_size
+        self._analysis_cache = LRUCache(cache_size)
     
     def analyze(
         self,
@@ -54,6 +65,9 @@ class CitationGraphAnalyzer:
         """
         Perform complete citation analysis.
         
+        When the analyzer has a cache, repeat analyses of an identical
+        manuscript are served from a bounded LRU cache.
+        
         Args:
             manuscript_text: Full text of the manuscript
             references: List of reference dictionaries
@@ -62,6 +76,48 @@ class CitationGraphAnalyzer:
         Returns:
             CitationAnalysisResult object
         """
+        if not self.cache_size:
+            return self._analyze(manuscript_text, references, author_names)
+        
+        try:
+            key = freeze((manuscript_text, references, author_names))
+        except TypeError:
+            # Unhashable data: analyze without caching
+            return self._analyze(manuscript_text, references, author_names)
+        
+        cache = self._analysis_cache
+        result = cache.get(key)
+        if result is None:
+            result = self._analyze(manuscript_text, references, author_names)
+            cache.put(key, result)
+            analysis_timestamp = result.analysis_timestamp
+        else:
+            analysis_timestamp = datetime.now()
+        
+        # Patterns are mutable, so each is copied along with the containers
+        return replace(
+            result,
+            citation_clusters=[set(cluster) for cluster in result.citation_clusters],
+            suspicious_patterns=[
+                replace(
+                    pattern,
+                    evidence=list(pattern.evidence),
+                    affected_references=list(pattern.affected_references)
+                )
+                for pattern in result.suspicious_patterns
+            ],
+            temporal_distribution=dict(result.temporal_distribution),
+            analysis_timestamp=analysis_timestamp,
+            recommendations=list(result.recommendations)
+        )
+    
+    def _analyze(
+        self,
+        manuscript_text: str,
+        references: List[Dict],
+        author_names: Optional[List[str]]
+    ) -> CitationAnalysisResult:
+        """Analyze one manuscript without consulting the cache"""
         # Phase 1: Extract citations
         citations = self.extractor.extract_citations(manuscript_text, references)
         
@@ -139,15 +195,17 @@ class CitationGraphAnalyzer:
         if not author_names:
             return 0
         
-        # Normalize author names
-        normalized_authors = set(name.lower().split()[-1] for name in author_names)
+        # Normalize author names to a set of last names, so each reference
+        # author is one hash lookup. Only the last word is needed, so
+        # names are split once from the right instead of into every word.
+        normalized_authors = {name.lower().rsplit(None, 1)[-1] for name in author_names}
         
         self_count = 0
         for ref in references:
             ref_authors = ref.get('authors', [])
             for ref_author in ref_authors:
                 # Check last name match
-                ref_lastname = ref_author.lower().split()[-1]
+                ref_lastname = ref_author.lower().rsplit(None, 1)[-1]
                 if ref_lastname in normalized_authors:
                     self_count += 1
                     break
@@ -164,9 +222,12 @@ class CitationGraphAnalyzer:
         visited = set()
         clusters = []
         
+        # Build adjacency once so the search doesn't rescan the edge list
+        adjacency = graph.adjacency()
+        
         for node in graph.nodes:
             if node not in visited:
-                cluster = self._explore_cluster(graph, node, visited)
+                cluster = self._explore_cluster(graph, node, visited, adjacency)
                 if len(cluster) > 1:
                     clusters.append(cluster)
         
@@ -176,9 +237,16 @@ class CitationGraphAnalyzer:
         self,
         graph: CitationGraph,
         start_node: str,
-        visited: Set[str]
+        visited: Set[str],
+        adjacency: Optional[Dict[str, List[str]]] = None
     ) -> Set[str]:
-        """Explore a citation cluster using DFS"""
+        """
+        Explore a citation cluster using DFS.
+        
+        adjacency is the graph's adjacency(), when the caller has it.
+        """
+        if adjacency is None:
+            adjacency = graph.adjacency()
         cluster = set()
         stack = [start_node]
         
@@ -189,8 +257,7 @@ class CitationGraphAnalyzer:
                 cluster.add(node)
                 
                 # Add connected nodes
-                neighbors = graph.get_neighbors(node)
-                stack.extend(n for n in neighbors if n not in visited)
+                stack.extend(n for n in adjacency[node] if n not in visited)
         
         return cluster
     
@@ -44,6 +44,22 @@ class CitationGraph:
                 neighbors.append(from_node)
         return neighbors
     
+    def adjacency(self) -> Dict[str, List[str]]:
+        """
+        Neighbors of every node, built in one pass over the edges.
+        
+        Each node's list is what get_neighbors returns for it, without
+        rescanning the edge list once per node. Edge endpoints that were
+        never added as nodes get lists too, so every node reachable over
+        the edges can be looked up.
+        """
+        adjacency = {node: [] for node in self.nodes}
+        for from_node, to_node in self.edges:
+            adjacency.setdefault(from_node, []).append(to_node)
+            if to_node != from_node:
+                adjacency.setdefault(to_node, []).append(from_node)
+        return adjacency
+    
     def get_degree(self, node_id: str) -> int:
         """Get degree of a node"""
         return len(self.get_neighbors(node_id))
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from .graph_builder import CitationGraph
 
 
-@dataclass
+@dataclass(slots=True)
 class CitationPattern:
     """Represents a detected citation pattern"""
     pattern_type: str
@@ -54,13 +54,16 @@ class PatternDetector:
         """
         patterns = []
         
+        # Build adjacency once so detectors don't rescan the edge list
+        adjacency = graph.adjacency()
+        
         # Detect citation clustering
-        clustering_pattern = self._detect_clustering(graph)
+        clustering_pattern = self._detect_clustering(graph, adjacency)
         if clustering_pattern:
             patterns.append(clustering_pattern)
         
         # Detect citation cartels (reciprocal citation rings)
-        cartel_patterns = self._detect_citation_cartels(graph)
+        cartel_patterns = self._detect_citation_cartels(graph, adjacency)
         patterns.extend(cartel_patterns)
         
         # Detect abnormal citation concentration
@@ -75,7 +78,11 @@ class PatternDetector:
         
         return patterns
     
-    def _detect_clustering(self, graph: CitationGraph) -> CitationPattern:
+    def _detect_clustering(
+        self,
+        graph: CitationGraph,
+        adjacency: Dict[str, List[str]]
+    ) -> CitationPattern:
         """
         Detect excessive citation clustering.
         
@@ -89,7 +96,7 @@ class PatternDetector:
         nodes_with_neighbors = 0
         
         for node in graph.nodes:
-            neighbors = graph.get_neighbors(node)
+            neighbors = adjacency[node]
             if len(neighbors) < 2:
                 continue
             
@@ -99,7 +106,7 @@ class PatternDetector:
             neighbor_edges = 0
             for i, n1 in enumerate(neighbors):
                 for n2 in neighbors[i+1:]:
-                    if (n1, n2) in graph.edges or (n2, n1) in graph.edges:
+                    if n2 in adjacency[n1]:
                         neighbor_edges += 1
             
             # Calculate clustering for this node
@@ -126,7 +133,11 @@ class PatternDetector:
         
         return None
     
-    def _detect_citation_cartels(self, graph: CitationGraph) -> List[CitationPattern]:
+    def _detect_citation_cartels(
+        self,
+        graph: CitationGraph,
+        adjacency: Dict[str, List[str]]
+    ) -> List[CitationPattern]:
         """
         Detect citation cartels (reciprocal citation rings).
         
@@ -136,14 +147,14 @@ class PatternDetector:
         
         # Find strongly connected components (simple cycle detection)
         for node in graph.nodes:
-            neighbors = graph.get_neighbors(node)
+            neighbors = adjacency[node]
             
             for neighbor in neighbors:
                 # Check for reciprocal edges
-                if node in graph.get_neighbors(neighbor):
+                if node in adjacency[neighbor]:
                     # Found reciprocal citation
                     # Check if it's part of a larger ring
-                    ring_size = self._find_ring_size(graph, node, neighbor)
+                    ring_size = self._find_ring_size(adjacency, node, neighbor)
                     
                     if ring_size >= self.RECIPROCAL_CITATION_THRESHOLD:
                         patterns.append(CitationPattern(
@@ -161,7 +172,7 @@ class PatternDetector:
     
     def _find_ring_size(
         self,
-        graph: CitationGraph,
+        adjacency: Dict[str, List[str]],
         start_node: str,
         current_node: str,
         visited: Set[str] = None
@@ -173,17 +184,20 @@ class PatternDetector:
         if current_node in visited:
             return len(visited)
         
+        # Backtracking search: the visited set always holds the current path
         visited.add(current_node)
-        neighbors = graph.get_neighbors(current_node)
+        neighbors = adjacency[current_node]
         
         max_ring = len(visited)
         for neighbor in neighbors:
             if neighbor == start_node:
-                return len(visited) + 1
+                max_ring = len(visited) + 1
+                break
             elif neighbor not in visited:
-                ring_size = self._find_ring_size(graph, start_node, neighbor, visited.copy())
+                ring_size = self._find_ring_size(adjacency, start_node, neighbor, visited)
                 max_ring = max(max_ring, ring_size)
         
+        visited.discard(current_node)
         return max_ring
     
     def _detect_concentration(
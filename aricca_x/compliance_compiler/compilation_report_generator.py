@@ -5,6 +5,7 @@ Implements proprietary report generation algorithms.
 Copyright (c) 2026. All rights reserved.
 """
 
+from collections import Counter
 from typing import List, Dict, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -12,7 +13,7 @@ from .manuscript_parser import ParsedManuscript
 from .compliance_checker import ComplianceIssue
 
 
-@dataclass
+@dataclass(slots=True)
 class CompilationReport:
     """Complete compilation report for a manuscript"""
     manuscript_path: str
@@ -189,11 +190,7 @@ class CompilationReportGenerator:
     
     def _categorize_issues(self, issues: List[ComplianceIssue]) -> Dict[str, int]:
         """Categorize issues by category"""
-        categories = {}
-        for issue in issues:
-            category = issue.category
-            categories[category] = categories.get(category, 0) + 1
-        return categories
+        return dict(Counter(issue.category for issue in issues))
     
     def format_report_text(self, report: CompilationReport) -> str:
         """
@@ -8,7 +8,7 @@ Copyright (c) 2026. All rights reserved.
 import re
 from typing import List, Dict
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntFlag
 from .manuscript_parser import ParsedManuscript, ManuscriptSection
 
 
@@ -19,7 +19,16 @@ class IssueSeverity(Enum):
     INFO = "info"
 
 
-@dataclass
+class ComplianceCheck(IntFlag):
+    """Compliance check categories, combinable as a bitmask"""
+    FORMATTING = 1
+    REFERENCES = 2
+    STRUCTURE = 4
+    METADATA = 8
+    ALL = FORMATTING | REFERENCES | STRUCTURE | METADATA
+
+
+@dataclass(slots=True)
 class ComplianceIssue:
     """Represents a compliance issue found in the manuscript"""
     issue_id: str
@@ -65,6 +74,33 @@ class ComplianceChecker:
         self.style_guide = style_guide
         self.rules = self.STYLE_GUIDES.get(style_guide, self.STYLE_GUIDES['IEEE'])
     
+    def check_all(
+        self,
+        manuscript: ParsedManuscript,
+        checks: ComplianceCheck = ComplianceCheck.ALL
+    ) -> List[ComplianceIssue]:
+        """
+        Run the selected compliance checks in one call.
+        
+        Args:
+            manuscript: Parsed manuscript to check
+            checks: Bitmask of ComplianceCheck categories to run
+            
+        Returns:
+            Issues from every selected check, in formatting, references,
+            structure, metadata order
+        """
+        issues = []
+        if checks & ComplianceCheck.FORMATTING:
+            issues += self.check_formatting(manuscript)
+        if checks & ComplianceCheck.REFERENCES:
+            issues += self.check_references(manuscript)
+        if checks & ComplianceCheck.STRUCTURE:
+            issues += self.check_structure(manuscript)
+        if checks & ComplianceCheck.METADATA:
+            issues += self.check_metadata(manuscript)
+        return issues
+    
     def check_formatting(self, manuscript: ParsedManuscript) -> List[ComplianceIssue]:
         """Check formatting compliance"""
         issues = []
@@ -5,17 +5,23 @@ Implements proprietary compilation algorithms for manuscript analysis.
 Copyright (c) 2026. All rights reserved.
 """
 
+import os
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from .._common import LRUCache
 from .manuscript_parser import ManuscriptParser, ParsedManuscript
-from .compliance_checker import ComplianceChecker, ComplianceIssue
+from .compliance_checker import ComplianceChecker, ComplianceCheck, ComplianceIssue
 from .compilation_report_generator import CompilationReportGenerator, CompilationReport
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CompilerConfiguration:
-    """Configuration for the compliance compiler"""
+    """Configuration for the compliance compiler; immutable and hashable"""
     check_formatting: bool = True
     check_references: bool = True
     check_structure: bool = True
@@ -24,6 +30,27 @@ class CompilerConfiguration:
     style_guide: str = "IEEE"  # IEEE, ACM, APA, etc.
 
 
+@lru_cache(maxsize=8)
+def _shared_checker(style_guide: str) -> ComplianceChecker:
+    """Checkers only hold their style rules, so one per style guide is shared"""
+    return ComplianceChecker(style_guide)
+
+
+@lru_cache(maxsize=8)
+def _config_checks(config: CompilerConfiguration) -> ComplianceCheck:
+    """Compliance checks switched on in a configuration, as a bitmask"""
+    checks = ComplianceCheck(0)
+    if config.check_formatting:
+        checks |= ComplianceCheck.FORMATTING
+    if config.check_references:
+        checks |= ComplianceCheck.REFERENCES
+    if config.check_structure:
+        checks |= ComplianceCheck.STRUCTURE
+    if config.check_metadata:
+        checks |= ComplianceCheck.METADATA
+    return checks
+
+
 class ComplianceCompiler:
     """
     Compiles and validates manuscript submissions for compliance.
@@ -33,6 +60,10 @@ class ComplianceCompiler:
     software compiler.
     """
     
+    # Parses kept per compiler for resubmitted files. Parsed sections hold
+    # most of a manuscript's text, so only the most recent few are kept.
+    _PARSE_CACHE_SIZE = 32
+    
     def __init__(self, config: Optional[CompilerConfiguration] = None):
         """
         Initialize the compliance compiler.
@@ -41,9 +72,14 @@ class ComplianceCompiler:
             config: Optional compiler configuration
         """
         self.config = config or CompilerConfiguration()
-        self.parser = ManuscriptParser()
-        self.checker = ComplianceChecker(self.config.style_guide)
+        # Reports never read the manuscript text, and parses are cached
+        self.parser = ManuscriptParser(
+            retain_raw_text=False,
+            style_guide=self.config.style_guide
+        )
+        self.checker = _shared_checker(self.config.style_guide)
         self.report_generator = CompilationReportGenerator()
+        self._parse_cache = LRUCache(self._PARSE_CACHE_SIZE)
     
     def compile(
         self,
@@ -64,22 +100,25 @@ class ComplianceCompiler:
             CompilationReport with all findings
         """
         # Phase 1: Parse manuscript
-        parsed_manuscript = self.parser.parse(manuscript_path, manuscript_format)
-        
+        parsed_manuscript = self._parse_manuscript(manuscript_path, manuscript_format)
+        return self._compile_parsed(parsed_manuscript)
+    
+    def _compile_from_text(
+        self,
+        manuscript_text: str,
+        manuscript_path: str,
+        manuscript_format: str
+    ) -> CompilationReport:
+        """Compile a manuscript whose text has already been read"""
+        parsed_manuscript = self.parser.parse_text(
+            manuscript_text, manuscript_path, manuscript_format
+        )
+        return self._compile_parsed(parsed_manuscript)
+    
+    def _compile_parsed(self, parsed_manuscript: ParsedManuscript) -> CompilationReport:
+        """Run compliance checks on a parsed manuscript and build its report"""
         # Phase 2: Run compliance checks
-        issues = []
-        
-        if self.config.check_formatting:
-            issues.extend(self.checker.check_formatting(parsed_manuscript))
-        
-        if self.config.check_references:
-            issues.extend(self.checker.check_references(parsed_manuscript))
-        
-        if self.config.check_structure:
-            issues.extend(self.checker.check_structure(parsed_manuscript))
-        
-        if self.config.check_metadata:
-            issues.extend(self.checker.check_metadata(parsed_manuscript))
+        issues = self.checker.check_all(parsed_manuscript, self._enabled_checks())
         
         # Phase 3: Generate compilation report
         report = self.report_generator.generate_report(
@@ -90,37 +129,138 @@ class ComplianceCompiler:
         
         return report
     
+    def _enabled_checks(self) -> ComplianceCheck:
+        """Compliance checks switched on in the configuration, as a bitmask"""
+        return _config_checks(self.config)
+    
+    def _parse_manuscript(
+        self,
+        manuscript_path: str,
+        manuscript_format: str
+    ) -> ParsedManuscript:
+        """
+        Parse a manuscript, reusing the previous result for unchanged files.
+        
+        Parses are cached on path, format, modification time and size, so
+        resubmitting an untouched file skips extraction and parsing. The
+        checks and the report generator only read a parse, so repeat calls
+        share it, with the parse time refreshed for each call.
+        """
+        try:
+            stat = os.stat(manuscript_path)
+        except OSError:
+            # Nothing on disk to key the cache on
+            return self.parser.parse(manuscript_path, manuscript_format)
+        
+        key = (manuscript_path, manuscript_format, stat.st_mtime_ns, stat.st_size)
+        parsed = self._parse_cache.get(key)
+        if parsed is None:
+            parsed = self.parser.parse(manuscript_path, manuscript_format)
+            self._parse_cache.put(key, parsed)
+            return parsed
+        
+        return replace(parsed, parse_timestamp=datetime.now())
+    
     def compile_batch(
         self,
         manuscript_paths: List[str],
-        manuscript_format: str = "pdf"
+        manuscript_format: str = "pdf",
+        max_workers: Optional[int] = None
     ) -> List[CompilationReport]:
         """
         Compile multiple manuscripts in batch.
         
+        Manuscripts are independent, so they are compiled in parallel
+        worker processes. Files are read ahead on a thread so workers
+        never wait on disk, with at most two manuscripts per worker
+        held in memory. Reports are returned in input order.
+        
         Args:
             manuscript_paths: List of manuscript file paths
             manuscript_format: Format of manuscripts
+            max_workers: Optional worker process count (defaults to the
+                ARICCA_X_COMPILE_WORKERS environment variable, then CPU count)
             
         Returns:
             List of CompilationReport objects
         """
+        workers = max_workers or self._batch_worker_count()
+        workers = min(workers, len(manuscript_paths))
+        
+        if workers <= 1:
+            return [
+                self._compile_or_error(path, manuscript_format)
+                for path in manuscript_paths
+            ]
+        
         reports = []
+        in_flight = deque()
+        read_ahead = deque()
+        remaining = iter(manuscript_paths)
+        window = 2 * workers
         
-        for path in manuscript_paths:
-            try:
-                report = self.compile(path, manuscript_format)
-                reports.append(report)
-            except Exception as e:
-                # Create error report
-                error_report = self.report_generator.generate_error_report(
-                    manuscript_path=path,
-                    error_message=str(e)
-                )
-                reports.append(error_report)
+        with ThreadPoolExecutor(max_workers=1) as reader, \
+                ProcessPoolExecutor(max_workers=workers) as executor:
+            def queue_reads():
+                for path in islice(remaining, window - len(read_ahead)):
+                    read_ahead.append((path, reader.submit(
+                        self.parser.extract_text, path, manuscript_format
+                    )))
+            
+            queue_reads()
+            while read_ahead:
+                path, text = read_ahead.popleft()
+                try:
+                    compiled = executor.submit(
+                        self._compile_from_text, text.result(), path, manuscript_format
+                    )
+                except Exception as e:
+                    # Unreadable file: queue its failure in order, so it
+                    # becomes an error report like a failed compilation
+                    compiled = Future()
+                    compiled.set_exception(e)
+                in_flight.append((path, compiled))
+                queue_reads()
+                if len(in_flight) >= window:
+                    reports.append(self._batch_result(*in_flight.popleft()))
+            
+            while in_flight:
+                reports.append(self._batch_result(*in_flight.popleft()))
         
         return reports
     
+    def _batch_result(self, manuscript_path: str, future: Future) -> CompilationReport:
+        """Result of a batch compilation, or an error report if it failed"""
+        try:
+            return future.result()
+        except Exception as e:
+            return self._error_report(manuscript_path, e)
+    
+    def _compile_or_error(
+        self,
+        manuscript_path: str,
+        manuscript_format: str
+    ) -> CompilationReport:
+        """Compile a manuscript, falling back to an error report on failure"""
+        try:
+            return self.compile(manuscript_path, manuscript_format)
+        except Exception as e:
+            return self._error_report(manuscript_path, e)
+    
+    def _error_report(self, manuscript_path: str, error: Exception) -> CompilationReport:
+        """Report for a manuscript whose compilation failed"""
+        return self.report_generator.generate_error_report(
+            manuscript_path=manuscript_path,
+            error_message=str(error)
+        )
+    
+    def _batch_worker_count(self) -> int:
+        """Worker processes for batch compilation"""
+        configured = os.environ.get('ARICCA_X_COMPILE_WORKERS', '')
+        if configured.isdigit() and int(configured) > 0:
+            return int(configured)
+        return os.cpu_count() or 1
+    
     def get_compliance_summary(self, report: CompilationReport) -> Dict[str, any]:
         """
         Get a summary of compliance status.
@@ -131,11 +271,12 @@ class ComplianceCompiler:
         Returns:
             Dictionary with summary statistics
         """
+        severities = Counter(issue.severity for issue in report.issues)
         return {
             'total_issues': len(report.issues),
-            'errors': sum(1 for i in report.issues if i.severity == 'error'),
-            'warnings': sum(1 for i in report.issues if i.severity == 'warning'),
-            'info': sum(1 for i in report.issues if i.severity == 'info'),
+            'errors': severities['error'],
+            'warnings': severities['warning'],
+            'info': severities['info'],
             'compliance_score': report.compliance_score,
             'is_compliant': report.is_compliant,
             'compilation_status': report.compilation_status
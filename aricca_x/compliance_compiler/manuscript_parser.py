@@ -6,13 +6,17 @@ Copyright (c) 2026. All rights reserved.
 """
 
 import re
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate, islice
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class ManuscriptSection:
     """Represents a section of the manuscript"""
     title: str
@@ -23,7 +27,7 @@ class ManuscriptSection:
     word_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ManuscriptReference:
     """Represents a bibliographic reference"""
     ref_id: str
@@ -59,11 +63,22 @@ class ParsedManuscript:
     tables_count: int
     equations_count: int
     citation_count: int
-    raw_text: str
+    raw_text: Optional[str]  # None when the parser does not retain text
     parse_timestamp: datetime
     parse_confidence: float
 
 
+@lru_cache(maxsize=None)
+def _section_alternation(patterns: Tuple[str, ...]) -> re.Pattern:
+    """
+    Fuse section styles into one ordered alternation.
+    
+    Each style contributes a (number, title) group pair. Compiled once per
+    distinct pattern set and shared by every parser using it.
+    """
+    return re.compile('|'.join(f'(?:{p})' for p in patterns), re.MULTILINE)
+
+
 class ManuscriptParser:
     """
     Parses manuscripts into structured intermediate representation.
@@ -89,10 +104,77 @@ class ManuscriptParser:
         r'([^.]+)\s+\((\d{4})\)\.\s+([^.]+)\.\s+([^.]+)\.',
     ]
     
-    def __init__(self):
-        """Initialize the manuscript parser"""
-        self.section_patterns = [re.compile(p, re.MULTILINE) for p in self.SECTION_PATTERNS]
-        self.reference_patterns = [re.compile(p) for p in self.REFERENCE_PATTERNS]
+    # Section styles ordered by how often each style guide's templates use
+    # them. Manuscripts mix header styles, so every style is kept; only the
+    # order changes, and the styles never capture a header differently.
+    # Guides not listed here use SECTION_PATTERNS order.
+    STYLE_SECTION_PATTERNS = {
+        # Roman sections with lettered subsections
+        'IEEE': (SECTION_PATTERNS[1], SECTION_PATTERNS[2], SECTION_PATTERNS[0]),
+        # Numbered sections and subsections
+        'ACM': tuple(SECTION_PATTERNS),
+    }
+    
+    _REFERENCE_RE = tuple(re.compile(p) for p in REFERENCE_PATTERNS)
+    
+    # Precompiled extraction and counting patterns
+    _COMPILED = {
+        # Lines that could start a section header once stripped; every
+        # SECTION_PATTERNS style opens with a digit or capitals and a dot
+        'section_candidate': re.compile(r'^[^\S\n]*(?:\d|[A-Z]+\.)', re.MULTILINE),
+        'abstract': re.compile(
+            r'(?:abstract|ABSTRACT)\s*[:\-]?\s*\n?(.*?)(?:\n\n|keywords|introduction)',
+            re.IGNORECASE | re.DOTALL
+        ),
+        'keywords': re.compile(
+            r'(?:keywords|KEYWORDS)\s*[:\-]?\s*\n?(.+?)(?:\n\n|\n[A-Z])',
+            re.IGNORECASE | re.DOTALL
+        ),
+        'keyword_split': re.compile(r'[,;\n]'),
+        'email': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+        'ref_section': re.compile(
+            r'(?:references|bibliography|works cited)\s*\n(.*?)(?:\n\n\n|$)',
+            re.IGNORECASE | re.DOTALL
+        ),
+        'ref_marker': re.compile(r'\n\[(\d+)\]'),
+        # Authors, quoted title and year of one reference in a single
+        # match. Each field is an optional lookahead from the start, so it
+        # finds exactly what a separate anchored match/search would.
+        'reference': re.compile(
+            r'(?=(?P<authors>[^,.]+(?:,\s*[^,.]+)*)[,.])?'
+            r'(?=(?s:.*?)"(?P<title>[^"]+)")?'
+            r'(?=(?s:.*?)\b(?P<year>(?:19|20)\d{2})\b)?'
+        ),
+        'author_split': re.compile(r'\s+and\s+|,\s*'),
+        # Figure/table/equation/citation markers fused into one scan.
+        # Display equations are counted as pairs of "$$" delimiters.
+        'elements': re.compile(
+            r'(?P<figure>(?i:figure|fig\.)\s+\d+)'
+            r'|(?P<table>(?i:table)\s+\d+)'
+            r'|(?P<citation>\[\d+(?:,\s*\d+)*\])'
+            r'|(?P<equation_delim>\$\$)'
+            r'|(?P<equation_env>\\begin\{equation\})'
+        ),
+    }
+    
+    def __init__(self, retain_raw_text: bool = True, style_guide: Optional[str] = None):
+        """
+        Initialize the manuscript parser.
+        
+        Args:
+            retain_raw_text: Keep the extracted text on ParsedManuscript.
+                Callers that only need the parsed structure can disable this
+                so cached results don't pin every full manuscript in memory.
+            style_guide: Optional style guide; section detection tries the
+                header styles that guide uses most first.
+        """
+        self.retain_raw_text = retain_raw_text
+        self.style_guide = style_guide
+        # Shared compiled patterns; nothing is compiled per instance
+        self.section_pattern = _section_alternation(tuple(
+            self.STYLE_SECTION_PATTERNS.get(style_guide, self.SECTION_PATTERNS)
+        ))
+        self.reference_patterns = self._REFERENCE_RE
     
     def parse(self, file_path: str, file_format: str) -> ParsedManuscript:
         """
@@ -106,22 +188,39 @@ class ManuscriptParser:
             ParsedManuscript object
         """
         # Extract raw text based on format
-        raw_text = self._extract_text(file_path, file_format)
+        raw_text = self.extract_text(file_path, file_format)
+        return self.parse_text(raw_text, file_path, file_format)
+    
+    def parse_text(self, raw_text: str, file_path: str, file_format: str) -> ParsedManuscript:
+        """
+        Parse already extracted manuscript text.
+        
+        Args:
+            raw_text: Text extracted from the manuscript file
+            file_path: Path the text was read from
+            file_format: Format ("pdf", "latex", "docx")
+            
+        Returns:
+            ParsedManuscript object
+        """
+        # Index lines once; metadata and section parsing share it
+        lines, line_offsets = self._line_index(raw_text)
         
         # Parse metadata
-        metadata = self._parse_metadata(raw_text)
+        metadata = self._parse_metadata(raw_text, lines)
         
         # Parse sections
-        sections = self._parse_sections(raw_text)
+        sections = self._parse_sections(raw_text, lines, line_offsets)
         
         # Parse references
         references = self._parse_references(raw_text)
         
-        # Count elements
-        figures_count = self._count_figures(raw_text)
-        tables_count = self._count_tables(raw_text)
-        equations_count = self._count_equations(raw_text)
-        citation_count = self._count_citations(raw_text)
+        # Count elements (single pass over the text)
+        element_counts = self._count_elements(raw_text)
+        figures_count = element_counts['figures']
+        tables_count = element_counts['tables']
+        equations_count = element_counts['equations']
+        citation_count = element_counts['citations']
         
         # Calculate parse confidence
         confidence = self._calculate_parse_confidence(
@@ -138,12 +237,12 @@ class ManuscriptParser:
             tables_count=tables_count,
             equations_count=equations_count,
             citation_count=citation_count,
-            raw_text=raw_text,
+            raw_text=raw_text if self.retain_raw_text else None,
             parse_timestamp=datetime.now(),
             parse_confidence=confidence
         )
     
-    def _extract_text(self, file_path: str, file_format: str) -> str:
+    def extract_text(self, file_path: str, file_format: str) -> str:
         """
         Extract text from manuscript file.
         
@@ -161,97 +260,109 @@ class ManuscriptParser:
                 return ""
         return ""
     
-    def _parse_metadata(self, text: str) -> ManuscriptMetadata:
+    def _parse_metadata(self, text: str, lines: Optional[List[str]] = None) -> ManuscriptMetadata:
         """Parse manuscript metadata"""
         metadata = ManuscriptMetadata()
         
-        # Extract title (usually first major line)
-        lines = [l.strip() for l in text.split('\n') if l.strip()]
-        if lines:
-            # Find first substantial line (likely title)
-            for line in lines[:10]:
-                if 20 < len(line) < 200 and not line.startswith(('Abstract', 'Keywords')):
-                    metadata.title = line
-                    break
+        if lines is None:
+            lines = text.split('\n')
+        
+        # Extract title (usually first major line); only the first ten
+        # non-empty lines are candidates, so stop stripping there
+        for line in islice(filter(None, map(str.strip, lines)), 10):
+            if 20 < len(line) < 200 and not line.startswith(('Abstract', 'Keywords')):
+                metadata.title = line
+                break
         
         # Extract abstract
-        abstract_match = re.search(
-            r'(?:abstract|ABSTRACT)\s*[:\-]?\s*\n?(.*?)(?:\n\n|keywords|introduction)',
-            text,
-            re.IGNORECASE | re.DOTALL
-        )
+        abstract_match = self._COMPILED['abstract'].search(text)
         if abstract_match:
             metadata.abstract = abstract_match.group(1).strip()
         
         # Extract keywords
-        keywords_match = re.search(
-            r'(?:keywords|KEYWORDS)\s*[:\-]?\s*\n?(.+?)(?:\n\n|\n[A-Z])',
-            text,
-            re.IGNORECASE | re.DOTALL
-        )
+        keywords_match = self._COMPILED['keywords'].search(text)
         if keywords_match:
             keywords_text = keywords_match.group(1)
             # Split by commas, semicolons, or newlines
             metadata.keywords = [
-                k.strip() for k in re.split(r'[,;\n]', keywords_text)
+                k.strip() for k in self._COMPILED['keyword_split'].split(keywords_text)
                 if k.strip()
             ]
         
         # Count pages and words (approximate)
         metadata.page_count = text.count('\f') + 1  # Form feed character
-        metadata.word_count = len(text.split())
+        # Words never span a newline, so count per line instead of
+        # materializing one list holding every token in the document
+        metadata.word_count = sum(map(len, map(str.split, lines)))
         
         # Extract authors (look for email patterns or author sections)
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text[:2000])  # Look in first 2000 chars
+        emails = self._COMPILED['email'].findall(text, 0, 2000)  # Look in first 2000 chars
         if emails:
             metadata.authors = [f"Author <{email}>" for email in emails[:5]]
         
         return metadata
     
-    def _parse_sections(self, text: str) -> List[ManuscriptSection]:
+    def _line_index(self, text: str) -> Tuple[List[str], List[int]]:
+        """
+        Split text into lines and record where each line starts.
+        
+        offsets[i] is the offset of line i in text; a final entry one past
+        the end of the text closes the last line.
+        """
+        lines = text.split('\n')
+        offsets = list(accumulate((len(line) + 1 for line in lines), initial=0))
+        return lines, offsets
+    
+    def _parse_sections(
+        self,
+        text: str,
+        lines: Optional[List[str]] = None,
+        offsets: Optional[List[int]] = None
+    ) -> List[ManuscriptSection]:
         """Parse document sections"""
         sections = []
-        lines = text.split('\n')
+        if lines is None or offsets is None:
+            lines, offsets = self._line_index(text)
         
-        # Find section headers
-        for i, line in enumerate(lines):
-            for pattern in self.section_patterns:
-                match = pattern.match(line.strip())
-                if match:
-                    section_num = match.group(1)
-                    section_title = match.group(2)
-                    
-                    # Determine section level
-                    if '.' in section_num:
-                        level = section_num.count('.') + 1
-                    else:
-                        level = 1
-                    
-                    # Find section content (until next section)
-                    content_lines = []
-                    j = i + 1
-                    while j < len(lines):
-                        next_line = lines[j].strip()
-                        # Check if it's another section
-                        is_section = any(p.match(next_line) for p in self.section_patterns)
-                        if is_section:
-                            break
-                        content_lines.append(lines[j])
-                        j += 1
-                    
-                    content = '\n'.join(content_lines)
-                    
-                    sections.append(ManuscriptSection(
-                        title=section_title,
-                        level=level,
-                        content=content,
-                        line_start=i,
-                        line_end=j,
-                        word_count=len(content.split())
-                    ))
-                    
-                    break
+        # Pass 1: find section header lines. One scan over the whole text
+        # picks out candidate lines, and only those are stripped and matched.
+        # Both loops run as comprehensions with their lookups bound locally.
+        match_header = self.section_pattern.match
+        candidate_lines = [
+            bisect_right(offsets, candidate.start()) - 1
+            for candidate in self._COMPILED['section_candidate'].finditer(text)
+        ]
+        headers = [
+            (line_number, match)
+            for line_number in candidate_lines
+            if (match := match_header(lines[line_number].strip()))
+        ]
+        
+        # Pass 2: section content runs until the next header
+        ends = [line_number for line_number, _ in headers[1:]]
+        ends.append(len(lines))
+        for (i, match), j in zip(headers, ends):
+            # The title is the last group matched; its number precedes it
+            section_num = match.group(match.lastindex - 1)
+            section_title = match.group(match.lastindex)
+            
+            # Determine section level
+            if '.' in section_num:
+                level = section_num.count('.') + 1
+            else:
+                level = 1
+            
+            # Lines i+1 .. j-1, sliced straight out of the text
+            content = text[offsets[i + 1]:offsets[j] - 1]
+            
+            sections.append(ManuscriptSection(
+                title=section_title,
+                level=level,
+                content=content,
+                line_start=i,
+                line_end=j,
+                word_count=len(content.split())
+            ))
         
         return sections
     
@@ -260,87 +371,64 @@ class ManuscriptParser:
         references = []
         
         # Find references section
-        ref_section_match = re.search(
-            r'(?:references|bibliography|works cited)\s*\n(.*?)(?:\n\n\n|$)',
-            text,
-            re.IGNORECASE | re.DOTALL
-        )
+        ref_section_match = self._COMPILED['ref_section'].search(text)
         
         if not ref_section_match:
             return references
         
         ref_text = ref_section_match.group(1)
         
-        # Extract individual references
-        # Split by reference numbers like [1], [2], etc.
-        ref_splits = re.split(r'\n\[(\d+)\]', ref_text)
-        
-        for i in range(1, len(ref_splits), 2):
-            if i + 1 < len(ref_splits):
-                ref_id = ref_splits[i]
-                ref_content = ref_splits[i + 1].strip()
-                
-                # Parse reference components
-                authors = self._extract_authors(ref_content)
-                title = self._extract_title(ref_content)
-                year = self._extract_year(ref_content)
-                
-                references.append(ManuscriptReference(
-                    ref_id=ref_id,
-                    raw_text=ref_content,
-                    authors=authors,
-                    title=title,
-                    year=year,
-                    venue=None
-                ))
+        # Extract individual references. Entries start at reference
+        # numbers like [1], [2], etc. and run to the next marker
+        markers = list(self._COMPILED['ref_marker'].finditer(ref_text))
+        ends = [marker.start() for marker in markers[1:]]
+        ends.append(len(ref_text))
+        
+        for marker, content_end in zip(markers, ends):
+            ref_id = marker.group(1)
+            ref_content = ref_text[marker.end():content_end].strip()
+            
+            # Parse reference components
+            fields = self._COMPILED['reference'].match(ref_content)
+            authors = self._split_authors(fields.group('authors'))
+            year = fields.group('year')
+            
+            references.append(ManuscriptReference(
+                ref_id=ref_id,
+                raw_text=ref_content,
+                authors=authors,
+                title=fields.group('title'),
+                year=int(year) if year else None,
+                venue=None
+            ))
         
         return references
     
-    def _extract_authors(self, ref_text: str) -> List[str]:
-        """Extract author names from reference text"""
-        # Simple heuristic: names before the first comma or period
-        match = re.match(r'^([^,.]+(?:,\s*[^,.]+)*)[,.]', ref_text)
-        if match:
-            authors_text = match.group(1)
-            # Split by "and" or comma
-            authors = re.split(r'\s+and\s+|,\s*', authors_text)
-            return [a.strip() for a in authors if a.strip()]
-        return []
-    
-    def _extract_title(self, ref_text: str) -> Optional[str]:
-        """Extract title from reference text"""
-        # Look for text in quotes
-        match = re.search(r'"([^"]+)"', ref_text)
-        if match:
-            return match.group(1)
-        return None
-    
-    def _extract_year(self, ref_text: str) -> Optional[int]:
-        """Extract publication year from reference text"""
-        match = re.search(r'\b(19|20)\d{2}\b', ref_text)
-        if match:
-            return int(match.group(0))
-        return None
+    def _split_authors(self, authors_text: Optional[str]) -> List[str]:
+        """Split the leading author list of a reference into names"""
+        if not authors_text:
+            return []
+        # Split by "and" or comma
+        authors = self._COMPILED['author_split'].split(authors_text)
+        return [a.strip() for a in authors if a.strip()]
     
-    def _count_figures(self, text: str) -> int:
-        """Count figures in manuscript"""
-        return len(re.findall(r'(?:figure|fig\.)\s+\d+', text, re.IGNORECASE))
-    
-    def _count_tables(self, text: str) -> int:
-        """Count tables in manuscript"""
-        return len(re.findall(r'table\s+\d+', text, re.IGNORECASE))
-    
-    def _count_equations(self, text: str) -> int:
-        """Count equations in manuscript"""
-        # Look for equation markers
-        equation_markers = len(re.findall(r'\$\$.*?\$\$', text, re.DOTALL))
-        equation_markers += len(re.findall(r'\\begin\{equation\}', text))
-        return equation_markers
-    
-    def _count_citations(self, text: str) -> int:
-        """Count in-text citations"""
-        # Count citation patterns like [1], [2,3], etc.
-        return len(re.findall(r'\[\d+(?:,\s*\d+)*\]', text))
+    def _count_elements(self, text: str) -> Dict[str, int]:
+        """
+        Count figures, tables, equations and in-text citations.
+        
+        Scans the text once with the fused element pattern instead of
+        running a separate findall per element type.
+        """
+        counts = Counter(
+            match.lastgroup for match in self._COMPILED['elements'].finditer(text)
+        )
+        return {
+            'figures': counts['figure'],
+            'tables': counts['table'],
+            # Each $$...$$ block contributes two delimiters
+            'equations': counts['equation_delim'] // 2 + counts['equation_env'],
+            'citations': counts['citation']
+        }
     
     def _calculate_parse_confidence(
         self,
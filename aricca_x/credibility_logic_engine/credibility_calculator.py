@@ -5,13 +5,14 @@ Implements proprietary credibility calculation algorithms.
 Copyright (c) 2026. All rights reserved.
 """
 
-from typing import List
+from operator import mul
+from typing import List, Tuple
 from dataclasses import dataclass
-from .scoring_engine import ScoreComponents
+from .scoring_engine import ScoreComponents, ScoreComponentsColumns
 from .heuristic_evaluator import HeuristicResult
 
 
-@dataclass
+@dataclass(slots=True)
 class CredibilityScore:
     """Final credibility score with breakdown"""
     credibility_score: float
@@ -32,6 +33,22 @@ class CredibilityCalculator:
     COMPONENT_TO_CREDIBILITY_WEIGHT = 0.60
     HEURISTIC_TO_CREDIBILITY_WEIGHT = 0.40
     
+    # Component credibility weights, aligned with COMPONENT_NAMES
+    COMPONENT_NAMES = (
+        'cfp_risk', 'website_credibility', 'indexing_credibility',
+        'contact_legitimacy', 'organizational_structure', 'publication_history'
+    )
+    COMPONENT_WEIGHTS = (0.25, 0.20, 0.20, 0.15, 0.10, 0.10)
+    
+    # Credibility deduction per failed heuristic, by importance
+    IMPORTANCE_WEIGHTS = {
+        'critical': 0.25,
+        'high': 0.15,
+        'medium': 0.10,
+        'low': 0.05
+    }
+    DEFAULT_IMPORTANCE_WEIGHT = 0.10
+    
     def __init__(self):
         """Initialize the credibility calculator"""
         pass
@@ -50,7 +67,8 @@ class CredibilityCalculator:
         Returns credibility score from 0.0 (low credibility) to 1.0 (high credibility).
         """
         # Calculate component-based credibility
-        component_credibility = self._calculate_component_credibility(score_components)
+        credibility_vector = self._credibility_vector(score_components)
+        component_credibility = self._weighted_credibility(credibility_vector)
         
         # Calculate heuristic-based credibility
         heuristic_credibility = self._calculate_heuristic_credibility(heuristic_results)
@@ -62,14 +80,7 @@ class CredibilityCalculator:
         )
         
         # Calculate component contributions
-        component_contribution = {
-            'cfp_risk': self._component_impact(score_components.cfp_risk_score, invert=True),
-            'website_credibility': self._component_impact(score_components.website_credibility_score),
-            'indexing_credibility': self._component_impact(score_components.indexing_credibility_score),
-            'contact_legitimacy': self._component_impact(score_components.contact_legitimacy_score),
-            'organizational_structure': self._component_impact(score_components.organizational_structure_score),
-            'publication_history': self._component_impact(score_components.publication_history_score)
-        }
+        component_contribution = dict(zip(self.COMPONENT_NAMES, credibility_vector))
         
         # Calculate heuristic contributions
         heuristic_contribution = self._calculate_heuristic_contributions(heuristic_results)
@@ -81,25 +92,69 @@ class CredibilityCalculator:
             heuristic_contribution=heuristic_contribution
         )
     
+    def calculate_component_credibility_batch(
+        self,
+        components_list: List[ScoreComponents]
+    ) -> List[float]:
+        """
+        Calculate component-based credibility for many venues at once.
+        
+        Args:
+            components_list: Score components, one per venue
+            
+        Returns:
+            Component credibility scores in input order
+        """
+        return self.calculate_component_credibility_columns(
+            ScoreComponentsColumns.from_components(components_list)
+        )
+    
+    def calculate_component_credibility_columns(
+        self,
+        columns: ScoreComponentsColumns
+    ) -> List[float]:
+        """
+        Calculate component-based credibility over a column-oriented batch.
+        
+        Accumulates one weighted column at a time, in the same order as
+        _weighted_credibility, so each score matches the per-venue result.
+        
+        Args:
+            columns: Score components stored column-wise
+            
+        Returns:
+            Component credibility scores in row order
+        """
+        credibility_columns = zip(columns.credibility_columns(), self.COMPONENT_WEIGHTS)
+        first_column, first_weight = next(credibility_columns)
+        totals = [value * first_weight for value in first_column]
+        for column, weight in credibility_columns:
+            totals = [total + value * weight for total, value in zip(totals, column)]
+        return [min(max(total, 0.0), 1.0) for total in totals]
+    
     def _calculate_component_credibility(self, components: ScoreComponents) -> float:
         """
         Calculate credibility from score components.
         
         Proprietary formula.
         """
+        return self._weighted_credibility(self._credibility_vector(components))
+    
+    def _credibility_vector(self, components: ScoreComponents) -> Tuple[float, ...]:
+        """Component scores as credibility values, aligned with COMPONENT_NAMES"""
         # Invert risk scores to get credibility scores
-        cfp_credibility = 1.0 - components.cfp_risk_score
-        
-        # Weighted average of all credibility indicators
-        credibility = (
-            cfp_credibility * 0.25 +
-            components.website_credibility_score * 0.20 +
-            components.indexing_credibility_score * 0.20 +
-            components.contact_legitimacy_score * 0.15 +
-            components.organizational_structure_score * 0.10 +
-            components.publication_history_score * 0.10
+        return (
+            1.0 - components.cfp_risk_score,
+            components.website_credibility_score,
+            components.indexing_credibility_score,
+            components.contact_legitimacy_score,
+            components.organizational_structure_score,
+            components.publication_history_score
         )
-        
+    
+    def _weighted_credibility(self, credibility_vector: Tuple[float, ...]) -> float:
+        """Weighted average of all credibility indicators"""
+        credibility = sum(map(mul, credibility_vector, self.COMPONENT_WEIGHTS))
         return min(max(credibility, 0.0), 1.0)
     
     def _calculate_heuristic_credibility(self, results: List[HeuristicResult]) -> float:
@@ -115,38 +170,25 @@ class CredibilityCalculator:
         credibility = 1.0
         
         # Deduct for failed heuristics based on importance
-        importance_weights = {
-            'critical': 0.25,
-            'high': 0.15,
-            'medium': 0.10,
-            'low': 0.05
-        }
+        weight_for = self.IMPORTANCE_WEIGHTS.get
+        default_weight = self.DEFAULT_IMPORTANCE_WEIGHT
         
         for result in results:
             if not result.passed:
-                weight = importance_weights.get(result.importance, 0.10)
-                credibility -= weight
+                credibility -= weight_for(result.importance, default_weight)
         
         return min(max(credibility, 0.0), 1.0)
     
-    def _component_impact(self, score: float, invert: bool = False) -> float:
-        """Calculate component's impact on final score"""
-        if invert:
-            score = 1.0 - score
-        return score
-    
     def _calculate_heuristic_contributions(
         self,
         results: List[HeuristicResult]
     ) -> dict:
         """Calculate individual heuristic contributions"""
-        contributions = {}
-        
-        for result in results:
-            contributions[result.name] = {
+        return {
+            result.name: {
                 'passed': result.passed,
                 'importance': result.importance,
                 'impact': result.score_impact
             }
-        
-        return contributions
+            for result in results
+        }
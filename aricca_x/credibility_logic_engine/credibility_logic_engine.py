@@ -5,15 +5,19 @@ Implements proprietary deterministic credibility scoring algorithms.
 Copyright (c) 2026. All rights reserved.
 """
 
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+import heapq
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict, List, Optional, Union
+from dataclasses import dataclass, replace
 from datetime import datetime
+from .._common import LRUCache, freeze, parallel_map
 from .scoring_engine import ScoringEngine, ScoreComponents
 from .heuristic_evaluator import HeuristicEvaluator, HeuristicResult
 from .credibility_calculator import CredibilityCalculator, CredibilityScore
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CredibilityAssessment:
     """Complete credibility assessment result"""
     venue_id: str
@@ -28,6 +32,44 @@ class CredibilityAssessment:
     flags: List[str]
 
 
+@dataclass(slots=True)
+class AssessmentColumns:
+    """
+    Column-oriented view of the assessment fields compare_venues reads.
+    
+    Build it once per batch with from_assessments and pass it to
+    compare_venues to skip re-reading every assessment on each comparison.
+    """
+    venue_name: List[str]
+    overall_credibility_score: List[float]
+    total_risk_score: List[float]
+    risk_level: List[str]
+    
+    @classmethod
+    def from_assessments(
+        cls,
+        assessments: List[CredibilityAssessment]
+    ) -> 'AssessmentColumns':
+        """Transpose per-venue assessments into columns"""
+        return cls(
+            venue_name=[a.venue_name for a in assessments],
+            overall_credibility_score=[a.overall_credibility_score for a in assessments],
+            total_risk_score=[a.score_components.total_risk_score for a in assessments],
+            risk_level=[a.risk_level for a in assessments]
+        )
+    
+    def __len__(self) -> int:
+        return len(self.overall_credibility_score)
+
+
+# Warning flags raised by _generate_flags
+_CRITICAL_PREFIX = "🚨 CRITICAL: "
+_CFP_CRITICAL_FLAG = _CRITICAL_PREFIX + "CFP shows severe predatory indicators"
+_INDEXING_WARNING_FLAG = "⚠️ WARNING: Indexing claims highly suspicious"
+_CONTACT_WARNING_FLAG = "⚠️ WARNING: Contact information appears illegitimate"
+_WEBSITE_WARNING_FLAG = "⚠️ WARNING: Website quality below acceptable standards"
+
+
 class CredibilityLogicEngine:
     """
     Non-ML credibility assessment engine using explicit rule-based logic.
@@ -45,34 +87,130 @@ class CredibilityLogicEngine:
         'critical': (0.75, 1.0)
     }
     
-    def __init__(self):
-        """Initialize the credibility logic engine"""
+    # RISK_THRESHOLDS flattened for lookup: the levels in order and the
+    # score at which each level after the first begins
+    _RISK_LEVELS = tuple(RISK_THRESHOLDS)
+    _RISK_BOUNDARIES = tuple(low for low, _ in RISK_THRESHOLDS.values())[1:]
+    _RISK_RANGE = (
+        min(low for low, _ in RISK_THRESHOLDS.values()),
+        max(high for _, high in RISK_THRESHOLDS.values())
+    )
+    
+    # Assessment confidence by data availability, indexed by
+    # cfp | website << 1 | fingerprint << 2. Each entry is the clamped sum
+    # of 0.35 (CFP), 0.35 (website) and 0.30 (fingerprint), added in that
+    # order so the values match accumulating them one at a time.
+    _CONFIDENCE_TABLE = (
+        0.0,
+        0.35,
+        0.35,
+        0.35 + 0.35,
+        0.30,
+        0.35 + 0.30,
+        0.35 + 0.30,
+        min(0.35 + 0.35 + 0.30, 1.0)
+    )
+    
+    # Risk levels eligible for the recommended venues in compare_venues
+    _RECOMMENDABLE_RISK_LEVELS = frozenset({'low', 'medium'})
+    
+    def __init__(self, cache_size: int = 0):
+        """
+        Initialize the credibility logic engine.
+        
+        Args:
+            cache_size: Number of recent assessments to keep for venues
+                that are assessed again with identical data. Keying costs
+                roughly a third of an assessment, so caching is off by
+                default and only pays off for repeat-heavy workloads.
+        """
         self.scoring_engine = ScoringEngine()
         self.heuristic_evaluator = HeuristicEvaluator()
         self.calculator = CredibilityCalculator()
+        self.cache_size = cache_size
+        self._assessment_cache = LRUCache(cache_size)
+        self._no_data_assessment = None
     
     def assess_credibility(
         self,
         venue_data: Dict,
         cfp_data: Optional[Dict] = None,
         website_data: Optional[Dict] = None,
-        fingerprint_data: Optional[Dict] = None
+        fingerprint_data: Optional[Dict] = None,
+        assessment_timestamp: Optional[datetime] = None
     ) -> CredibilityAssessment:
         """
         Perform complete credibility assessment of a venue.
         
         This is the main entry point that orchestrates all credibility
-        evaluation components using deterministic logic.
+        evaluation components using deterministic logic. When the engine
+        has a cache, repeat assessments of identical venue data are served
+        from a bounded LRU cache.
         
         Args:
             venue_data: Basic venue information
             cfp_data: Call for Papers analysis data
             website_data: Website analysis data
             fingerprint_data: Venue fingerprint data
+            assessment_timestamp: Optional timestamp to record; defaults
+                to the current time
             
         Returns:
             CredibilityAssessment object
         """
+        timestamp = assessment_timestamp or datetime.now()
+        if not self.cache_size:
+            return self._assess(venue_data, cfp_data, website_data, fingerprint_data, timestamp)
+        
+        try:
+            key = freeze((venue_data, cfp_data, website_data, fingerprint_data))
+        except TypeError:
+            # Unhashable data: assess without caching
+            return self._assess(venue_data, cfp_data, website_data, fingerprint_data, timestamp)
+        
+        cache = self._assessment_cache
+        assessment = cache.get(key)
+        if assessment is None:
+            assessment = self._assess(
+                venue_data, cfp_data, website_data, fingerprint_data, timestamp
+            )
+            cache.put(key, assessment)
+        
+        # Heuristic results are frozen down to their evidence tuples, so
+        # only the lists need copying
+        return replace(
+            assessment,
+            heuristic_results=list(assessment.heuristic_results),
+            assessment_timestamp=timestamp,
+            recommendations=list(assessment.recommendations),
+            flags=list(assessment.flags)
+        )
+    
+    def _assess(
+        self,
+        venue_data: Dict,
+        cfp_data: Optional[Dict],
+        website_data: Optional[Dict],
+        fingerprint_data: Optional[Dict],
+        assessment_timestamp: datetime
+    ) -> CredibilityAssessment:
+        """Assess one venue, reusing the shared result when it has no data"""
+        if not (cfp_data or website_data or fingerprint_data):
+            return self._assess_without_data(venue_data, assessment_timestamp)
+        
+        return self._run_phases(
+            venue_data, cfp_data, website_data, fingerprint_data, assessment_timestamp
+        )
+    
+    def _run_phases(
+        self,
+        venue_data: Dict,
+        cfp_data: Optional[Dict],
+        website_data: Optional[Dict],
+        fingerprint_data: Optional[Dict],
+        assessment_timestamp: datetime
+    ) -> CredibilityAssessment:
+        """Run every assessment phase for one venue"""
         venue_id = venue_data.get('venue_id', 'unknown')
         venue_name = venue_data.get('venue_name', 'Unknown Venue')
         
@@ -100,13 +238,22 @@ class CredibilityLogicEngine:
         # Phase 4: Determine risk level
         risk_level = self._determine_risk_level(credibility_score.total_risk_score)
         
-        # Phase 5: Generate recommendations and flags
+        # Phase 5: Generate recommendations and flags from one pass that
+        # classifies the failed heuristics
+        failed_count = 0
+        critical_failures = []
+        for result in heuristic_results:
+            if not result.passed:
+                failed_count += 1
+                if result.importance == 'critical':
+                    critical_failures.append(result)
+        
         recommendations = self._generate_recommendations(
             score_components,
-            heuristic_results,
+            failed_count,
             credibility_score
         )
-        flags = self._generate_flags(score_components, heuristic_results)
+        flags = self._generate_flags(score_components, critical_failures)
         
         # Phase 6: Calculate assessment confidence
         confidence = self._calculate_confidence(
@@ -121,33 +268,67 @@ class CredibilityLogicEngine:
             score_components=score_components,
             heuristic_results=heuristic_results,
             confidence=confidence,
-            assessment_timestamp=datetime.now(),
+            assessment_timestamp=assessment_timestamp,
             recommendations=recommendations,
             flags=flags
         )
     
+    def _assess_without_data(
+        self,
+        venue_data: Dict,
+        assessment_timestamp: datetime
+    ) -> CredibilityAssessment:
+        """
+        Assess a venue that has no CFP, website or fingerprint data.
+        
+        Every phase only reads those inputs, so such assessments differ
+        in identity and timestamp alone. The phases run once per engine
+        and later venues copy that result.
+        """
+        template = self._no_data_assessment
+        if template is None:
+            template = self._no_data_assessment = self._run_phases(
+                {}, None, None, None, assessment_timestamp
+            )
+        
+        return replace(
+            template,
+            venue_id=venue_data.get('venue_id', 'unknown'),
+            venue_name=venue_data.get('venue_name', 'Unknown Venue'),
+            heuristic_results=list(template.heuristic_results),
+            assessment_timestamp=assessment_timestamp,
+            recommendations=list(template.recommendations),
+            flags=list(template.flags)
+        )
+    
     def _determine_risk_level(self, risk_score: float) -> str:
         """
         Determine risk level from risk score.
         
         Proprietary risk classification logic.
         """
-        for level, (min_score, max_score) in self.RISK_THRESHOLDS.items():
-            if min_score <= risk_score < max_score:
-                return level
+        low, high = self._RISK_RANGE
+        if not low <= risk_score < high:
+            # Out-of-range (and NaN) scores are treated as critical
+            return 'critical'
         
-        return 'critical'
+        return self._RISK_LEVELS[bisect_right(self._RISK_BOUNDARIES, risk_score)]
     
     def _generate_recommendations(
         self,
         components: ScoreComponents,
-        heuristics: List[HeuristicResult],
+        failed_count: int,
         credibility: CredibilityScore
     ) -> List[str]:
         """
         Generate actionable recommendations.
         
         Proprietary recommendation generation algorithm.
+        
+        Args:
+            components: Score components of the venue
+            failed_count: Number of heuristics the venue failed
+            credibility: Final credibility score
         """
         recommendations = []
         
@@ -185,10 +366,9 @@ class CredibilityLogicEngine:
             )
         
         # Heuristic-based recommendations
-        failed_heuristics = [h for h in heuristics if not h.passed]
-        if len(failed_heuristics) > 3:
+        if failed_count > 3:
             recommendations.append(
-                f"Failed {len(failed_heuristics)} credibility checks. "
+                f"Failed {failed_count} credibility checks. "
                 "Review venue carefully against established predatory indicators."
             )
         
@@ -197,37 +377,35 @@ class CredibilityLogicEngine:
     def _generate_flags(
         self,
         components: ScoreComponents,
-        heuristics: List[HeuristicResult]
+        critical_failures: List[HeuristicResult]
     ) -> List[str]:
         """
         Generate warning flags.
         
         Proprietary flag generation algorithm.
+        
+        Args:
+            components: Score components of the venue
+            critical_failures: Failed heuristics of critical importance
         """
         flags = []
         
         # Critical flags
         if components.cfp_risk_score > 0.8:
-            flags.append("🚨 CRITICAL: CFP shows severe predatory indicators")
+            flags.append(_CFP_CRITICAL_FLAG)
         
         if components.indexing_credibility_score < 0.3:
-            flags.append("⚠️ WARNING: Indexing claims highly suspicious")
+            flags.append(_INDEXING_WARNING_FLAG)
         
         # Important flags
         if components.contact_legitimacy_score < 0.4:
-            flags.append("⚠️ WARNING: Contact information appears illegitimate")
+            flags.append(_CONTACT_WARNING_FLAG)
         
         if components.website_credibility_score < 0.3:
-            flags.append("⚠️ WARNING: Website quality below acceptable standards")
+            flags.append(_WEBSITE_WARNING_FLAG)
         
         # Heuristic flags
-        critical_failures = [
-            h for h in heuristics
-            if not h.passed and h.importance == 'critical'
-        ]
-        if critical_failures:
-            for failure in critical_failures:
-                flags.append(f"🚨 CRITICAL: {failure.name}")
+        flags.extend(_CRITICAL_PREFIX + failure.name for failure in critical_failures)
         
         return flags
     
@@ -242,100 +420,112 @@ class CredibilityLogicEngine:
         
         Proprietary confidence calculation algorithm.
         """
-        confidence = 0.0
-        
         # Data availability
-        if cfp_data:
-            confidence += 0.35
-        if website_data:
-            confidence += 0.35
-        if fingerprint_data:
-            confidence += 0.30
-        
-        return min(confidence, 1.0)
+        return self._CONFIDENCE_TABLE[
+            bool(cfp_data) | bool(website_data) << 1 | bool(fingerprint_data) << 2
+        ]
     
     def batch_assess(
         self,
-        venues: List[Dict]
+        venues: List[Dict],
+        n_jobs: Optional[int] = None
     ) -> List[CredibilityAssessment]:
         """
         Assess multiple venues in batch.
         
+        Venues are assessed independently, so large batches can be spread
+        over worker processes. Assessments are returned in input order and
+        share one batch timestamp.
+        
         Args:
             venues: List of venue data dictionaries
+            n_jobs: Optional worker process count; batches run serially
+                unless more than one worker is requested
             
         Returns:
             List of CredibilityAssessment objects
         """
-        assessments = []
-        
-        for venue in venues:
-            try:
-                assessment = self.assess_credibility(
-                    venue_data=venue,
-                    cfp_data=venue.get('cfp_data'),
-                    website_data=venue.get('website_data'),
-                    fingerprint_data=venue.get('fingerprint_data')
-                )
-                assessments.append(assessment)
-            except Exception as e:
-                # Create error assessment
-                assessments.append(CredibilityAssessment(
-                    venue_id=venue.get('venue_id', 'error'),
-                    venue_name=venue.get('venue_name', 'Error'),
-                    overall_credibility_score=0.0,
-                    risk_level='critical',
-                    score_components=ScoreComponents(),
-                    heuristic_results=[],
-                    confidence=0.0,
-                    assessment_timestamp=datetime.now(),
-                    recommendations=[f"Assessment failed: {str(e)}"],
-                    flags=["🚨 CRITICAL: Assessment error"]
-                ))
-        
-        return assessments
+        return parallel_map(self._assess_or_error, venues, datetime.now(), n_jobs=n_jobs)
+    
+    def _assess_or_error(self, venue: Dict, timestamp: datetime) -> CredibilityAssessment:
+        """Assess one batch venue, falling back to an error assessment"""
+        try:
+            return self.assess_credibility(
+                venue_data=venue,
+                cfp_data=venue.get('cfp_data'),
+                website_data=venue.get('website_data'),
+                fingerprint_data=venue.get('fingerprint_data'),
+                assessment_timestamp=timestamp
+            )
+        except Exception as e:
+            # Create error assessment
+            return CredibilityAssessment(
+                venue_id=venue.get('venue_id', 'error'),
+                venue_name=venue.get('venue_name', 'Error'),
+                overall_credibility_score=0.0,
+                risk_level='critical',
+                score_components=ScoreComponents(),
+                heuristic_results=[],
+                confidence=0.0,
+                assessment_timestamp=timestamp,
+                recommendations=[f"Assessment failed: {str(e)}"],
+                flags=["🚨 CRITICAL: Assessment error"]
+            )
     
     def compare_venues(
         self,
-        assessments: List[CredibilityAssessment]
+        assessments: Union[List[CredibilityAssessment], AssessmentColumns]
     ) -> Dict[str, any]:
         """
         Compare multiple venue assessments.
         
         Proprietary comparison algorithm.
+        
+        Args:
+            assessments: Venue assessments, or their AssessmentColumns
         """
         if not assessments:
             return {}
         
-        # Calculate statistics
-        scores = [a.overall_credibility_score for a in assessments]
-        risk_scores = [a.score_components.total_risk_score for a in assessments]
-        
-        # Rank venues
-        ranked = sorted(
-            assessments,
-            key=lambda a: a.overall_credibility_score,
-            reverse=True
+        if not isinstance(assessments, AssessmentColumns):
+            assessments = AssessmentColumns.from_assessments(assessments)
+        names = assessments.venue_name
+        scores = assessments.overall_credibility_score
+        risk_scores = assessments.total_risk_score
+        risk_levels = Counter(assessments.risk_level)
+        
+        # Rank venues by index. Only the extremes and the top
+        # recommendations are reported, so select them instead of sorting
+        # every assessment; ties resolve as in a stable descending sort.
+        by_score = scores.__getitem__
+        indices = range(len(scores))
+        best = max(indices, key=by_score)
+        worst = min(reversed(indices), key=by_score)
+        recommendable = self._RECOMMENDABLE_RISK_LEVELS
+        recommended = heapq.nlargest(
+            5,
+            [i for i, level in zip(indices, assessments.risk_level) if level in recommendable],
+            key=by_score
         )
         
         return {
-            'total_venues': len(assessments),
+            'total_venues': len(scores),
             'average_credibility': sum(scores) / len(scores),
             'average_risk': sum(risk_scores) / len(risk_scores),
             'risk_distribution': {
-                level: sum(1 for a in assessments if a.risk_level == level)
-                for level in ['low', 'medium', 'high', 'critical']
+                level: risk_levels[level]
+                for level in self._RISK_LEVELS
             },
             'best_venue': {
-                'name': ranked[0].venue_name,
-                'score': ranked[0].overall_credibility_score
+                'name': names[best],
+                'score': scores[best]
             },
             'worst_venue': {
-                'name': ranked[-1].venue_name,
-                'score': ranked[-1].overall_credibility_score
+                'name': names[worst],
+                'score': scores[worst]
             },
             'recommended_venues': [
-                {'name': a.venue_name, 'score': a.overall_credibility_score}
-                for a in ranked if a.risk_level in ['low', 'medium']
-            ][:5]
+                {'name': names[i], 'score': scores[i]}
+                for i in recommended
+            ]
         }
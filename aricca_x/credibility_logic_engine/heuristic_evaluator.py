@@ -5,21 +5,101 @@ Implements proprietary heuristic evaluation rules.
 Copyright (c) 2026. All rights reserved.
 """
 
-from typing import Dict, List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HeuristicResult:
     """Result from a single heuristic evaluation"""
     name: str
     description: str
     passed: bool
     importance: str  # "critical", "high", "medium", "low"
-    evidence: List[str]
+    evidence: Tuple[str, ...]  # a tuple, so results are fully immutable
     score_impact: float
 
 
+# Results for heuristics that have no data to evaluate. They are constant,
+# so one shared instance each is returned instead of a fresh allocation.
+_NO_CFP_ACCEPTANCE = HeuristicResult(
+    name="Acceptance Rate Check",
+    description="Checks for unrealistic acceptance guarantees",
+    passed=True,
+    importance="high",
+    evidence=("No CFP data available",),
+    score_impact=0.0
+)
+_NO_CFP_URGENCY = HeuristicResult(
+    name="Urgency Check",
+    description="Checks for excessive deadline pressure",
+    passed=True,
+    importance="medium",
+    evidence=("No CFP data available",),
+    score_impact=0.0
+)
+_NO_WEBSITE_QUALITY = HeuristicResult(
+    name="Website Quality Check",
+    description="Evaluates website professionalism and completeness",
+    passed=False,
+    importance="high",
+    evidence=("No website data available",),
+    score_impact=0.2
+)
+_NO_FINGERPRINT_INDEXING = HeuristicResult(
+    name="Indexing Claims Check",
+    description="Validates database indexing claims",
+    passed=True,
+    importance="high",
+    evidence=("No indexing claims to verify",),
+    score_impact=0.0
+)
+_NO_INDEXING_CLAIMS = HeuristicResult(
+    name="Indexing Claims Check",
+    description="Validates database indexing claims",
+    passed=True,
+    importance="high",
+    evidence=("No indexing claims made",),
+    score_impact=0.0
+)
+_NO_CFP_FEE = HeuristicResult(
+    name="Fee Prominence Check",
+    description="Checks for excessive emphasis on fees",
+    passed=True,
+    importance="medium",
+    evidence=("No CFP data available",),
+    score_impact=0.0
+)
+_NO_CFP_SPEED = HeuristicResult(
+    name="Publication Speed Check",
+    description="Checks for unrealistic publication speed claims",
+    passed=True,
+    importance="low",
+    evidence=("No CFP data available",),
+    score_impact=0.0
+)
+_NO_CONTACT_DATA = HeuristicResult(
+    name="Contact Information Check",
+    description="Validates legitimacy of contact information",
+    passed=True,
+    importance="medium",
+    evidence=("Contact information appears legitimate",),
+    score_impact=0.0
+)
+
+# evaluate_all's results when no CFP, website or fingerprint data is given
+_NO_DATA_RESULTS = (
+    _NO_CFP_ACCEPTANCE,
+    _NO_CFP_URGENCY,
+    _NO_WEBSITE_QUALITY,
+    _NO_FINGERPRINT_INDEXING,
+    _NO_CONTACT_DATA,
+    _NO_CFP_FEE,
+    _NO_CFP_SPEED
+)
+
+
 class HeuristicEvaluator:
     """
     Evaluates credibility using rule-based heuristics.
@@ -27,6 +107,18 @@ class HeuristicEvaluator:
     Implements proprietary heuristic rules for predatory venue detection.
     """
     
+    # Keyword sets matched against lowercased text, one scan per text
+    _COMPILED = {
+        'acceptance': re.compile(r'acceptance|guarantee'),
+        'fee': re.compile(r'fee|payment'),
+        'speed_claims': re.compile(
+            r'fast publication|quick publication|rapid publication'
+            r'|immediate publication|fast track'
+        ),
+        # Academic mail domains, matched as-is against contact addresses
+        'academic_email': re.compile(r'\.(?:edu|ac\.)'),
+    }
+    
     def __init__(self):
         """Initialize the heuristic evaluator"""
         pass
@@ -43,10 +135,20 @@ class HeuristicEvaluator:
         
         Returns list of heuristic results.
         """
+        if not (cfp_data or website_data or fingerprint_data):
+            # Every heuristic falls back to its no-data result
+            return list(_NO_DATA_RESULTS)
+        
         results = []
         
+        # Heuristics 1 and 6 share one pass over the suspicious patterns
+        acceptance_suspicious, fee_suspicious = self._classify_suspicious_patterns(cfp_data)
+        
+        # CFP text heuristics share one lowercased copy of the text
+        cfp_text = cfp_data.get('cfp_text', '').lower() if cfp_data else ''
+        
         # Heuristic 1: Unrealistic acceptance rates
-        results.append(self._eval_acceptance_rate(cfp_data))
+        results.append(self._eval_acceptance_rate(cfp_data, acceptance_suspicious))
         
         # Heuristic 2: Excessive urgency in CFP
         results.append(self._eval_urgency_indicators(cfp_data))
@@ -61,51 +163,59 @@ class HeuristicEvaluator:
         results.append(self._eval_contact_info(cfp_data, website_data))
         
         # Heuristic 6: Fees mentioned prominently
-        results.append(self._eval_fee_prominence(cfp_data))
+        results.append(self._eval_fee_prominence(cfp_data, fee_suspicious))
         
         # Heuristic 7: Publication speed claims
-        results.append(self._eval_publication_speed(cfp_data))
+        results.append(self._eval_publication_speed(cfp_data, cfp_text))
         
         return results
     
-    def _eval_acceptance_rate(self, cfp_data: Optional[Dict]) -> HeuristicResult:
+    def _classify_suspicious_patterns(self, cfp_data: Optional[Dict]) -> Tuple[bool, bool]:
+        """
+        Flag acceptance and fee claims among the CFP's suspicious patterns.
+        
+        Lowercases each pattern once and checks both keyword sets in the
+        same pass. Returns (acceptance_suspicious, fee_suspicious).
+        """
+        acceptance_suspicious = fee_suspicious = False
+        if not cfp_data:
+            return acceptance_suspicious, fee_suspicious
+        
+        acceptance_search = self._COMPILED['acceptance'].search
+        fee_search = self._COMPILED['fee'].search
+        for pattern in cfp_data.get('suspicious_patterns', []):
+            lowered = pattern.lower()
+            acceptance_suspicious = acceptance_suspicious or acceptance_search(lowered) is not None
+            fee_suspicious = fee_suspicious or fee_search(lowered) is not None
+            if acceptance_suspicious and fee_suspicious:
+                break
+        
+        return acceptance_suspicious, fee_suspicious
+    
+    def _eval_acceptance_rate(
+        self,
+        cfp_data: Optional[Dict],
+        acceptance_suspicious: bool
+    ) -> HeuristicResult:
         """Evaluate claimed acceptance rates"""
         if not cfp_data:
-            return HeuristicResult(
-                name="Acceptance Rate Check",
-                description="Checks for unrealistic acceptance guarantees",
-                passed=True,
-                importance="high",
-                evidence=["No CFP data available"],
-                score_impact=0.0
-            )
+            return _NO_CFP_ACCEPTANCE
         
         suspicious = cfp_data.get('suspicious_patterns', [])
-        acceptance_suspicious = any(
-            'acceptance' in s.lower() or 'guarantee' in s.lower()
-            for s in suspicious
-        )
         
         return HeuristicResult(
             name="Acceptance Rate Check",
             description="Checks for unrealistic acceptance guarantees",
             passed=not acceptance_suspicious,
             importance="critical",
-            evidence=suspicious if acceptance_suspicious else ["No suspicious acceptance claims"],
+            evidence=tuple(suspicious) if acceptance_suspicious else ("No suspicious acceptance claims",),
             score_impact=0.3 if acceptance_suspicious else 0.0
         )
     
     def _eval_urgency_indicators(self, cfp_data: Optional[Dict]) -> HeuristicResult:
         """Evaluate urgency indicators in CFP"""
         if not cfp_data:
-            return HeuristicResult(
-                name="Urgency Check",
-                description="Checks for excessive deadline pressure",
-                passed=True,
-                importance="medium",
-                evidence=["No CFP data available"],
-                score_impact=0.0
-            )
+            return _NO_CFP_URGENCY
         
         urgency_indicators = cfp_data.get('urgency_indicators', [])
         excessive_urgency = len(urgency_indicators) > 3
@@ -115,21 +225,14 @@ class HeuristicEvaluator:
             description="Checks for excessive deadline pressure",
             passed=not excessive_urgency,
             importance="medium",
-            evidence=urgency_indicators if excessive_urgency else ["Normal urgency levels"],
+            evidence=tuple(urgency_indicators) if excessive_urgency else ("Normal urgency levels",),
             score_impact=0.15 if excessive_urgency else 0.0
         )
     
     def _eval_website_quality(self, website_data: Optional[Dict]) -> HeuristicResult:
         """Evaluate website quality"""
         if not website_data:
-            return HeuristicResult(
-                name="Website Quality Check",
-                description="Evaluates website professionalism and completeness",
-                passed=False,
-                importance="high",
-                evidence=["No website data available"],
-                score_impact=0.2
-            )
+            return _NO_WEBSITE_QUALITY
         
         has_ssl = website_data.get('has_ssl', False)
         has_contact = website_data.get('has_contact_page', False)
@@ -150,34 +253,20 @@ class HeuristicEvaluator:
             description="Evaluates website professionalism and completeness",
             passed=passed,
             importance="high",
-            evidence=evidence if not passed else ["Website meets quality standards"],
+            evidence=tuple(evidence) if not passed else ("Website meets quality standards",),
             score_impact=0.2 if not passed else 0.0
         )
     
     def _eval_indexing_claims(self, fingerprint_data: Optional[Dict]) -> HeuristicResult:
         """Evaluate indexing claims"""
         if not fingerprint_data:
-            return HeuristicResult(
-                name="Indexing Claims Check",
-                description="Validates database indexing claims",
-                passed=True,
-                importance="high",
-                evidence=["No indexing claims to verify"],
-                score_impact=0.0
-            )
+            return _NO_FINGERPRINT_INDEXING
         
         indexing_status = fingerprint_data.get('indexing_verification_status', {})
         claimed_indexers = fingerprint_data.get('claimed_indexers', [])
         
         if not claimed_indexers:
-            return HeuristicResult(
-                name="Indexing Claims Check",
-                description="Validates database indexing claims",
-                passed=True,
-                importance="high",
-                evidence=["No indexing claims made"],
-                score_impact=0.0
-            )
+            return _NO_INDEXING_CLAIMS
         
         suspicious_claims = sum(
             1 for status in indexing_status.values()
@@ -191,9 +280,9 @@ class HeuristicEvaluator:
             description="Validates database indexing claims",
             passed=passed,
             importance="high",
-            evidence=[
-                f"{suspicious_claims} unverified/suspicious indexing claims"
-            ] if not passed else ["Indexing claims appear legitimate"],
+            evidence=(
+                f"{suspicious_claims} unverified/suspicious indexing claims",
+            ) if not passed else ("Indexing claims appear legitimate",),
             score_impact=0.25 if not passed else 0.0
         )
     
@@ -203,14 +292,21 @@ class HeuristicEvaluator:
         website_data: Optional[Dict]
     ) -> HeuristicResult:
         """Evaluate contact information legitimacy"""
+        if not cfp_data and not website_data:
+            return _NO_CONTACT_DATA
+        
         evidence = []
         score = 0.0
         
         if cfp_data:
             emails = cfp_data.get('email_contacts', [])
-            academic_emails = sum(1 for e in emails if '.edu' in e or '.ac.' in e)
+            # Only the presence of an academic address matters, so scan all
+            # addresses as one newline-separated buffer
+            has_academic_email = (
+                self._COMPILED['academic_email'].search('\n'.join(emails)) is not None
+            )
             
-            if emails and academic_emails == 0:
+            if emails and not has_academic_email:
                 evidence.append("No academic email addresses")
                 score += 0.15
         
@@ -226,60 +322,45 @@ class HeuristicEvaluator:
             description="Validates legitimacy of contact information",
             passed=passed,
             importance="medium",
-            evidence=evidence if not passed else ["Contact information appears legitimate"],
+            evidence=tuple(evidence) if not passed else ("Contact information appears legitimate",),
             score_impact=score
         )
     
-    def _eval_fee_prominence(self, cfp_data: Optional[Dict]) -> HeuristicResult:
+    def _eval_fee_prominence(
+        self,
+        cfp_data: Optional[Dict],
+        fee_suspicious: bool
+    ) -> HeuristicResult:
         """Evaluate prominence of fee mentions"""
         if not cfp_data:
-            return HeuristicResult(
-                name="Fee Prominence Check",
-                description="Checks for excessive emphasis on fees",
-                passed=True,
-                importance="medium",
-                evidence=["No CFP data available"],
-                score_impact=0.0
-            )
-        
-        # Check for fee-related suspicious patterns
-        suspicious = cfp_data.get('suspicious_patterns', [])
-        fee_suspicious = any('fee' in s.lower() or 'payment' in s.lower() for s in suspicious)
+            return _NO_CFP_FEE
         
+        # fee_suspicious flags fee-related suspicious patterns
         return HeuristicResult(
             name="Fee Prominence Check",
             description="Checks for excessive emphasis on fees",
             passed=not fee_suspicious,
             importance="medium",
-            evidence=["Excessive fee emphasis detected"] if fee_suspicious else ["Normal fee mentions"],
+            evidence=("Excessive fee emphasis detected",) if fee_suspicious else ("Normal fee mentions",),
             score_impact=0.1 if fee_suspicious else 0.0
         )
     
-    def _eval_publication_speed(self, cfp_data: Optional[Dict]) -> HeuristicResult:
-        """Evaluate publication speed claims"""
+    def _eval_publication_speed(
+        self,
+        cfp_data: Optional[Dict],
+        cfp_text: str
+    ) -> HeuristicResult:
+        """Evaluate publication speed claims in the lowercased CFP text"""
         if not cfp_data:
-            return HeuristicResult(
-                name="Publication Speed Check",
-                description="Checks for unrealistic publication speed claims",
-                passed=True,
-                importance="low",
-                evidence=["No CFP data available"],
-                score_impact=0.0
-            )
-        
-        cfp_text = cfp_data.get('cfp_text', '').lower()
-        speed_claims = [
-            'fast publication', 'quick publication', 'rapid publication',
-            'immediate publication', 'fast track'
-        ]
+            return _NO_CFP_SPEED
         
-        has_speed_claims = any(claim in cfp_text for claim in speed_claims)
+        has_speed_claims = self._COMPILED['speed_claims'].search(cfp_text) is not None
         
         return HeuristicResult(
             name="Publication Speed Check",
             description="Checks for unrealistic publication speed claims",
             passed=not has_speed_claims,
             importance="low",
-            evidence=["Suspicious publication speed claims"] if has_speed_claims else ["No speed claims"],
+            evidence=("Suspicious publication speed claims",) if has_speed_claims else ("No speed claims",),
             score_impact=0.1 if has_speed_claims else 0.0
         )
@@ -5,11 +5,12 @@ Implements proprietary scoring algorithms for credibility factors.
 Copyright (c) 2026. All rights reserved.
 """
 
-from typing import Dict, Optional
+from array import array
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScoreComponents:
     """Individual score components for credibility assessment"""
     cfp_risk_score: float = 0.5
@@ -21,6 +22,63 @@ class ScoreComponents:
     total_risk_score: float = 0.5
 
 
+@dataclass(slots=True)
+class ScoreComponentsColumns:
+    """
+    Column-oriented batch of ScoreComponents.
+    
+    Holds one contiguous array of doubles per component, so batch scoring
+    walks each component once instead of touching every field of every
+    venue object, at 8 bytes per score rather than a boxed float.
+    """
+    cfp_risk_score: array
+    website_credibility_score: array
+    indexing_credibility_score: array
+    contact_legitimacy_score: array
+    organizational_structure_score: array
+    publication_history_score: array
+    total_risk_score: array
+    
+    @classmethod
+    def from_components(cls, components_list: List[ScoreComponents]) -> 'ScoreComponentsColumns':
+        """Transpose per-venue ScoreComponents into columns"""
+        return cls(
+            cfp_risk_score=array('d', [c.cfp_risk_score for c in components_list]),
+            website_credibility_score=array('d', [c.website_credibility_score for c in components_list]),
+            indexing_credibility_score=array('d', [c.indexing_credibility_score for c in components_list]),
+            contact_legitimacy_score=array('d', [c.contact_legitimacy_score for c in components_list]),
+            organizational_structure_score=array('d', [c.organizational_structure_score for c in components_list]),
+            publication_history_score=array('d', [c.publication_history_score for c in components_list]),
+            total_risk_score=array('d', [c.total_risk_score for c in components_list])
+        )
+    
+    def __len__(self) -> int:
+        return len(self.total_risk_score)
+    
+    def row(self, index: int) -> ScoreComponents:
+        """Rebuild the ScoreComponents of a single venue"""
+        return ScoreComponents(
+            cfp_risk_score=self.cfp_risk_score[index],
+            website_credibility_score=self.website_credibility_score[index],
+            indexing_credibility_score=self.indexing_credibility_score[index],
+            contact_legitimacy_score=self.contact_legitimacy_score[index],
+            organizational_structure_score=self.organizational_structure_score[index],
+            publication_history_score=self.publication_history_score[index],
+            total_risk_score=self.total_risk_score[index]
+        )
+    
+    def credibility_columns(self) -> Tuple[array, ...]:
+        """Component columns as credibility values, CFP risk inverted"""
+        return (
+            array('d', [1.0 - risk for risk in self.cfp_risk_score]),
+            self.website_credibility_score,
+            self.indexing_credibility_score,
+            self.contact_legitimacy_score,
+            self.organizational_structure_score,
+            self.publication_history_score
+        )
+
+
 class ScoringEngine:
     """
     Calculates individual score components using proprietary algorithms.
@@ -38,6 +96,9 @@ class ScoringEngine:
         'publication_history': 0.10
     }
     
+    # COMPONENT_WEIGHTS unpacked once, in calculate_components order
+    _RISK_WEIGHTS = tuple(COMPONENT_WEIGHTS.values())
+    
     def __init__(self):
         """Initialize the scoring engine"""
         pass
@@ -62,13 +123,14 @@ class ScoringEngine:
         pub_history = self._score_publication_history(fingerprint_data)
         
         # Calculate weighted total risk (proprietary formula)
+        w_cfp, w_website, w_indexing, w_contact, w_org, w_pub = self._RISK_WEIGHTS
         total_risk = (
-            cfp_risk * self.COMPONENT_WEIGHTS['cfp_risk'] +
-            (1.0 - website_cred) * self.COMPONENT_WEIGHTS['website_credibility'] +
-            (1.0 - indexing_cred) * self.COMPONENT_WEIGHTS['indexing_credibility'] +
-            (1.0 - contact_legit) * self.COMPONENT_WEIGHTS['contact_legitimacy'] +
-            (1.0 - org_structure) * self.COMPONENT_WEIGHTS['organizational_structure'] +
-            (1.0 - pub_history) * self.COMPONENT_WEIGHTS['publication_history']
+            cfp_risk * w_cfp +
+            (1.0 - website_cred) * w_website +
+            (1.0 - indexing_cred) * w_indexing +
+            (1.0 - contact_legit) * w_contact +
+            (1.0 - org_structure) * w_org +
+            (1.0 - pub_history) * w_pub
         )
         
         return ScoreComponents(
@@ -81,6 +143,64 @@ class ScoringEngine:
             total_risk_score=min(total_risk, 1.0)
         )
     
+    def calculate_components_batch(
+        self,
+        cfp_list: List[Optional[Dict]],
+        website_list: List[Optional[Dict]],
+        fingerprint_list: List[Optional[Dict]]
+    ) -> ScoreComponentsColumns:
+        """
+        Calculate score components for many venues at once.
+        
+        Scores each component down its column and totals the weighted
+        risk across columns, without building a ScoreComponents per
+        venue. Each venue's values match calculate_components.
+        
+        Args:
+            cfp_list: CFP data, one entry per venue
+            website_list: Website data, one entry per venue
+            fingerprint_list: Fingerprint data, one entry per venue
+            
+        Returns:
+            ScoreComponentsColumns in venue order
+        """
+        cfp_risk = array('d', map(self._score_cfp_risk, cfp_list))
+        website_cred = array('d', map(self._score_website_credibility, website_list))
+        indexing_cred = array('d', map(self._score_indexing_credibility, fingerprint_list))
+        contact_legit = array('d', map(self._score_contact_legitimacy, cfp_list, website_list))
+        org_structure = array('d', map(
+            self._score_organizational_structure, website_list, fingerprint_list
+        ))
+        pub_history = array('d', map(self._score_publication_history, fingerprint_list))
+        
+        # Same weighted total as calculate_components, term for term
+        w_cfp, w_website, w_indexing, w_contact, w_org, w_pub = self._RISK_WEIGHTS
+        total_risk = array('d', [
+            min(
+                cfp * w_cfp +
+                (1.0 - website) * w_website +
+                (1.0 - indexing) * w_indexing +
+                (1.0 - contact) * w_contact +
+                (1.0 - org) * w_org +
+                (1.0 - pub) * w_pub,
+                1.0
+            )
+            for cfp, website, indexing, contact, org, pub in zip(
+                cfp_risk, website_cred, indexing_cred,
+                contact_legit, org_structure, pub_history
+            )
+        ])
+        
+        return ScoreComponentsColumns(
+            cfp_risk_score=cfp_risk,
+            website_credibility_score=website_cred,
+            indexing_credibility_score=indexing_cred,
+            contact_legitimacy_score=contact_legit,
+            organizational_structure_score=org_structure,
+            publication_history_score=pub_history,
+            total_risk_score=total_risk
+        )
+    
     def _score_cfp_risk(self, cfp_data: Optional[Dict]) -> float:
         """Score CFP risk (0.0 = low risk, 1.0 = high risk)"""
         if not cfp_data:
@@ -5,23 +5,50 @@ This script demonstrates the core functionality of ARICCA-X.
 Copyright (c) 2026. All rights reserved.
 """
 
-from aricca_x import (
-    CredibilityLogicEngine,
-    VenueFingerprintBuilder,
-    ComplianceCompiler,
-    ReportRenderer
-)
+import sys
+from contextlib import redirect_stdout
+from dataclasses import fields
+from functools import lru_cache
+from io import StringIO
+from pathlib import Path
+
+
+# Section separators and the title banner, built once at import
+_SEPARATOR = "="*80
+_RULE = "-"*80
+_BANNER = "\n".join([
+    "╔" + "═"*78 + "╗",
+    "║" + " "*78 + "║",
+    "║" + "ARICCA-X DEMONSTRATION EXAMPLES".center(78) + "║",
+    "║" + "Automated Research Integrity, Credibility & Compliance Analyzer".center(78) + "║",
+    "║" + " "*78 + "║",
+    "╚" + "═"*78 + "╝"
+])
+
+
+@lru_cache(maxsize=1)
+def _get_engine() -> 'CredibilityLogicEngine':
+    """Engine shared by the examples, built on first use"""
+    from aricca_x import CredibilityLogicEngine
+    return CredibilityLogicEngine()
+
+
+@lru_cache(maxsize=1)
+def _get_renderer() -> 'ReportRenderer':
+    """Renderer shared by the examples, built on first use"""
+    from aricca_x import ReportRenderer
+    return ReportRenderer()
 
 
 def example_1_venue_analysis():
     """Example 1: Analyze a research venue"""
-    print("\n" + "="*80)
+    print("\n" + _SEPARATOR)
     print("EXAMPLE 1: Venue Credibility Analysis")
-    print("="*80 + "\n")
+    print(_SEPARATOR + "\n")
     
     # Initialize engine
-    engine = CredibilityLogicEngine()
-    renderer = ReportRenderer()
+    engine = _get_engine()
+    renderer = _get_renderer()
     
     # Sample venue data
     venue_data = {
@@ -82,27 +109,26 @@ def example_1_venue_analysis():
             print(f"  • {rec}")
     
     # Generate detailed report
-    print("\n" + "-"*80)
+    print("\n" + _RULE)
     print("Generating detailed report...")
     report = renderer.render_assessment_report(
-        assessment.__dict__,
+        {f.name: getattr(assessment, f.name) for f in fields(assessment)},
         output_format='text',
         include_recommendations=True
     )
     
     # Save report
-    with open('venue_analysis_report.txt', 'w', encoding='utf-8') as f:
-        f.write(report)
+    Path('venue_analysis_report.txt').write_text(report, encoding='utf-8')
     print("Report saved to: venue_analysis_report.txt")
 
 
 def example_2_venue_comparison():
     """Example 2: Compare multiple venues"""
-    print("\n" + "="*80)
+    print("\n" + _SEPARATOR)
     print("EXAMPLE 2: Multi-Venue Comparison")
-    print("="*80 + "\n")
+    print(_SEPARATOR + "\n")
     
-    engine = CredibilityLogicEngine()
+    engine = _get_engine()
     
     # Sample venues with different risk levels
     venues = [
@@ -157,7 +183,7 @@ def example_2_venue_comparison():
         print(f"    Risk:  {assessment.risk_level.upper()}")
     
     # Compare venues
-    print("\n" + "-"*80)
+    print("\n" + _RULE)
     print("Generating comparison analysis...")
     comparison = engine.compare_venues(assessments)
     
@@ -180,14 +206,15 @@ def example_2_venue_comparison():
 
 def example_3_compliance_check():
     """Example 3: Check manuscript compliance"""
-    print("\n" + "="*80)
+    print("\n" + _SEPARATOR)
     print("EXAMPLE 3: Manuscript Compliance Check")
-    print("="*80 + "\n")
+    print(_SEPARATOR + "\n")
     
     # Note: This example demonstrates the API
     # In real usage, you'd provide an actual manuscript file
     
-    from aricca_x.compliance_compiler import CompilerConfiguration
+    from aricca_x import ComplianceCompiler
+    from aricca_x.compliance_compiler.compliance_compiler import CompilerConfiguration
     
     config = CompilerConfiguration(
         check_formatting=True,
@@ -220,9 +247,9 @@ def example_3_compliance_check():
 
 def example_4_citation_analysis():
     """Example 4: Analyze citation patterns"""
-    print("\n" + "="*80)
+    print("\n" + _SEPARATOR)
     print("EXAMPLE 4: Citation Pattern Analysis")
-    print("="*80 + "\n")
+    print(_SEPARATOR + "\n")
     
     from aricca_x import CitationGraphAnalyzer
     
@@ -279,25 +306,35 @@ def example_4_citation_analysis():
             print(f"  • {rec}")
 
 
+def _run_buffered(example):
+    """
+    Run an example, writing its output to stdout in one go.
+    
+    Output printed before an error is still written before the error
+    propagates.
+    """
+    buffer = StringIO()
+    try:
+        with redirect_stdout(buffer):
+            example()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+
+
 def main():
     """Run all examples"""
     print("\n")
-    print("╔" + "═"*78 + "╗")
-    print("║" + " "*78 + "║")
-    print("║" + "ARICCA-X DEMONSTRATION EXAMPLES".center(78) + "║")
-    print("║" + "Automated Research Integrity, Credibility & Compliance Analyzer".center(78) + "║")
-    print("║" + " "*78 + "║")
-    print("╚" + "═"*78 + "╝")
+    print(_BANNER)
     
     try:
-        example_1_venue_analysis()
-        example_2_venue_comparison()
-        example_3_compliance_check()
-        example_4_citation_analysis()
+        _run_buffered(example_1_venue_analysis)
+        _run_buffered(example_2_venue_comparison)
+        _run_buffered(example_3_compliance_check)
+        _run_buffered(example_4_citation_analysis)
         
-        print("\n" + "="*80)
+        print("\n" + _SEPARATOR)
         print("ALL EXAMPLES COMPLETED SUCCESSFULLY")
-        print("="*80 + "\n")
+        print(_SEPARATOR + "\n")
         
     except Exception as e:
         print(f"\nError running examples: {e}")
@@ -6,11 +6,27 @@ Copyright (c) 2026. All rights reserved.
 """
 
 import json
+import logging
+from dataclasses import fields, is_dataclass
 from enum import Enum
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, TextIO, Tuple
 from pathlib import Path
 
 
+log = logging.getLogger(__name__)
+
+
+# Values of these exact types are copied into exported dicts as-is
+_PLAIN_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+@lru_cache(maxsize=None)
+def _field_names(dataclass_type: type) -> Tuple[str, ...]:
+    """Field names of a dataclass type, looked up once per type"""
+    return tuple(f.name for f in fields(dataclass_type))
+
+
 class ExportFormat(Enum):
     """Supported export formats"""
     TEXT = "txt"
@@ -40,6 +56,36 @@ class ExportHandler:
         report_dict = self._report_to_dict(report)
         return json.dumps(report_dict, indent=2, default=str)
     
+    def stream_json(self, report: Any, fp: TextIO):
+        """
+        Write a report as JSON to an open text file.
+        
+        Produces the same text as export_json, but encodes it chunk by
+        chunk into the file instead of building the whole string first.
+        """
+        json.dump(self._report_to_dict(report), fp, indent=2, default=str)
+    
+    def save_json(self, report: Any, output_path: str) -> bool:
+        """
+        Save a report as JSON, streaming it to the file.
+        
+        Args:
+            report: Report object to export
+            output_path: Output file path
+            
+        Returns:
+            Success boolean
+        """
+        try:
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                self.stream_json(report, f)
+            
+            return True
+        except OSError:
+            log.exception("Error saving report to %s", output_path)
+            return False
+    
     def save_to_file(
         self,
         content: str,
@@ -60,35 +106,87 @@ class ExportHandler:
         try:
             # Ensure directory exists
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            log.exception("Error saving report to %s", output_path)
+            return False
+        
+        return self._write_file(content, output_path)
+    
+    def save_many(self, items: List[Tuple[str, str, ExportFormat]]) -> List[bool]:
+        """
+        Save several reports to files.
+        
+        Each output directory is created once, however many reports
+        are written into it.
+        
+        Args:
+            items: (content, output_path, format) for each report
             
-            # Write content
+        Returns:
+            Success boolean for each item, in order
+        """
+        created = {}
+        results = []
+        for content, output_path, _ in items:
+            directory = Path(output_path).parent
+            if directory not in created:
+                try:
+                    directory.mkdir(parents=True, exist_ok=True)
+                    created[directory] = True
+                except OSError:
+                    log.exception("Error saving report to %s", output_path)
+                    created[directory] = False
+            
+            results.append(created[directory] and self._write_file(content, output_path))
+        
+        return results
+    
+    def _write_file(self, content: str, output_path: str) -> bool:
+        """Write content to an existing directory, reporting failures"""
+        try:
             with open(output_path, 'w', encoding='utf-8') as f:
                 f.write(content)
             
             return True
-        except Exception as e:
-            print(f"Error saving report: {e}")
+        except OSError:
+            log.exception("Error saving report to %s", output_path)
             return False
     
     def _report_to_dict(self, report: Any) -> Dict:
         """Convert report object to dictionary"""
-        if hasattr(report, '__dict__'):
-            result = {}
-            for key, value in report.__dict__.items():
-                if hasattr(value, '__dict__'):
-                    result[key] = self._report_to_dict(value)
-                elif isinstance(value, list):
-                    result[key] = [
-                        self._report_to_dict(item) if hasattr(item, '__dict__') else item
-                        for item in value
-                    ]
-                elif isinstance(value, dict):
-                    result[key] = {
-                        k: self._report_to_dict(v) if hasattr(v, '__dict__') else v
-                        for k, v in value.items()
-                    }
-                else:
-                    result[key] = value
-            return result
+        attributes = self._attributes(report)
+        if attributes is not None:
+            return self._attributes_to_dict(attributes)
         else:
             return report
+    
+    def _attributes_to_dict(self, attributes: Dict) -> Dict:
+        """Convert an object's attribute mapping, recursing into nested objects"""
+        result = {}
+        for key, value in attributes.items():
+            if type(value) in _PLAIN_TYPES:
+                result[key] = value
+                continue
+            
+            # Each nested object's attributes are collected only once
+            nested = self._attributes(value)
+            if nested is not None:
+                result[key] = self._attributes_to_dict(nested)
+            elif isinstance(value, list):
+                result[key] = [self._report_to_dict(item) for item in value]
+            elif isinstance(value, dict):
+                result[key] = {
+                    k: self._report_to_dict(v)
+                    for k, v in value.items()
+                }
+            else:
+                result[key] = value
+        return result
+    
+    def _attributes(self, obj: Any) -> Optional[Dict]:
+        """Attribute mapping of an object, including slotted dataclasses"""
+        if hasattr(obj, '__dict__'):
+            return obj.__dict__
+        if is_dataclass(obj):
+            return {name: getattr(obj, name) for name in _field_names(type(obj))}
+        return None
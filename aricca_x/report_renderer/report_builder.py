@@ -5,12 +5,14 @@ Implements proprietary report construction algorithms.
 Copyright (c) 2026. All rights reserved.
 """
 
+from itertools import chain, islice
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
+from .._common import MISSING
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportSection:
     """A section of a report"""
     title: str
@@ -18,7 +20,7 @@ class ReportSection:
     subsections: List['ReportSection'] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Report:
     """Complete report structure"""
     title: str
@@ -35,6 +37,21 @@ class ReportBuilder:
     Uses proprietary report structuring algorithms.
     """
     
+    # Overall risk statement for each risk level
+    RISK_STATEMENTS = {
+        'low': "This venue appears legitimate with minimal risk indicators.",
+        'medium': "This venue shows mixed signals - exercise caution.",
+        'high': "This venue shows significant predatory indicators - high risk.",
+        'critical': "This venue shows severe predatory characteristics - critical risk. DO NOT submit."
+    }
+    
+    # Score components listed in the credibility section, with labels
+    CREDIBILITY_COMPONENTS = (
+        ('cfp_risk_score', "CFP Risk"),
+        ('website_credibility_score', "Website Credibility"),
+        ('indexing_credibility_score', "Indexing Credibility")
+    )
+    
     def __init__(self):
         """Initialize the report builder"""
         pass
@@ -43,12 +60,14 @@ class ReportBuilder:
         self,
         assessment_data: Dict,
         include_recommendations: bool = True,
-        include_evidence: bool = True
+        include_evidence: bool = True,
+        timestamp: Optional[datetime] = None
     ) -> Report:
         """
         Build a structured assessment report.
         
-        Proprietary report structuring algorithm.
+        Proprietary report structuring algorithm. Reports built together
+        can share one timestamp; it defaults to the current time.
         """
         sections = []
         
@@ -77,7 +96,7 @@ class ReportBuilder:
         return Report(
             title=f"ARICCA-X Analysis Report: {venue_name}",
             subtitle="Automated Research Integrity, Credibility & Compliance Analysis",
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             sections=sections,
             metadata={
                 'venue_id': assessment_data.get('venue_id', 'unknown'),
@@ -86,8 +105,12 @@ class ReportBuilder:
             }
         )
     
-    def build_comparison_report(self, comparison_data: Dict) -> Report:
-        """Build venue comparison report"""
+    def build_comparison_report(
+        self,
+        comparison_data: Dict,
+        timestamp: Optional[datetime] = None
+    ) -> Report:
+        """Build venue comparison report, stamped now unless a timestamp is given"""
         sections = []
         
         # Overview
@@ -118,21 +141,25 @@ class ReportBuilder:
             sections.append(ReportSection(
                 title="Recommended Venues",
                 content=[
-                    f"{i+1}. {v['name']} (Score: {v['score']:.2%})"
-                    for i, v in enumerate(recommended)
+                    f"{rank}. {v['name']} (Score: {v['score']:.2%})"
+                    for rank, v in enumerate(recommended, 1)
                 ]
             ))
         
         return Report(
             title="ARICCA-X Venue Comparison Report",
             subtitle="Multi-Venue Credibility Analysis",
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             sections=sections,
             metadata=comparison_data
         )
     
-    def build_compliance_report(self, compliance_data: Dict) -> Report:
-        """Build manuscript compliance report"""
+    def build_compliance_report(
+        self,
+        compliance_data: Dict,
+        timestamp: Optional[datetime] = None
+    ) -> Report:
+        """Build manuscript compliance report, stamped now unless a timestamp is given"""
         sections = []
         
         # Summary
@@ -175,7 +202,7 @@ class ReportBuilder:
         return Report(
             title="ARICCA-X Compliance Report",
             subtitle="Manuscript Compliance Analysis",
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             sections=sections,
             metadata=compliance_data
         )
@@ -183,17 +210,23 @@ class ReportBuilder:
     def _build_executive_summary(self, data: Dict) -> ReportSection:
         """Build executive summary section"""
         venue_name = data.get('venue_name', 'Unknown')
-        risk_level = data.get('risk_level', 'unknown').upper()
+        risk_level = data.get('risk_level', 'unknown')
+        display_level = risk_level.upper()
         score = data.get('overall_credibility_score', 0.0)
         
+        # Engine risk levels are already the lowercase statement keys
+        statement = self.RISK_STATEMENTS.get(risk_level)
+        if statement is None:
+            statement = self._get_risk_statement(display_level.lower())
+        
         return ReportSection(
             title="Executive Summary",
             content=[
                 f"Venue: {venue_name}",
                 f"Overall Credibility Score: {score:.2%}",
-                f"Risk Level: {risk_level}",
+                f"Risk Level: {display_level}",
                 "",
-                self._get_risk_statement(risk_level.lower())
+                statement
             ]
         )
     
@@ -202,12 +235,10 @@ class ReportBuilder:
         components = data.get('score_components', {})
         content = ["Score Breakdown:"]
         
-        if hasattr(components, 'cfp_risk_score'):
-            content.append(f"  • CFP Risk: {components.cfp_risk_score:.2f}")
-        if hasattr(components, 'website_credibility_score'):
-            content.append(f"  • Website Credibility: {components.website_credibility_score:.2f}")
-        if hasattr(components, 'indexing_credibility_score'):
-            content.append(f"  • Indexing Credibility: {components.indexing_credibility_score:.2f}")
+        for name, label in self.CREDIBILITY_COMPONENTS:
+            score = getattr(components, name, MISSING)
+            if score is not MISSING:
+                content.append(f"  • {label}: {score:.2f}")
         
         return ReportSection(
             title="Credibility Analysis",
@@ -225,7 +256,7 @@ class ReportBuilder:
     def _build_findings_section(self, data: Dict) -> ReportSection:
         """Build detailed findings section"""
         heuristic_results = data.get('heuristic_results', [])
-        failed = [h for h in heuristic_results if hasattr(h, 'passed') and not h.passed]
+        failed = [h for h in heuristic_results if not getattr(h, 'passed', True)]
         
         content = []
         if failed:
@@ -250,24 +281,18 @@ class ReportBuilder:
     
     def _build_evidence_section(self, data: Dict) -> ReportSection:
         """Build evidence section"""
-        evidence = []
-        
         heuristic_results = data.get('heuristic_results', [])
-        for h in heuristic_results:
-            if hasattr(h, 'evidence') and h.evidence:
-                evidence.extend(h.evidence[:3])  # Top 3 per heuristic
+        
+        # Top 3 per heuristic, stopping once the first 10 are collected
+        evidence = list(islice(chain.from_iterable(
+            h.evidence[:3] for h in heuristic_results if getattr(h, 'evidence', None)
+        ), 10))
         
         return ReportSection(
             title="Supporting Evidence",
-            content=evidence[:10] if evidence else ["Analysis based on available data"]
+            content=evidence if evidence else ["Analysis based on available data"]
         )
     
     def _get_risk_statement(self, risk_level: str) -> str:
         """Get appropriate risk statement"""
-        statements = {
-            'low': "This venue appears legitimate with minimal risk indicators.",
-            'medium': "This venue shows mixed signals - exercise caution.",
-            'high': "This venue shows significant predatory indicators - high risk.",
-            'critical': "This venue shows severe predatory characteristics - critical risk. DO NOT submit."
-        }
-        return statements.get(risk_level, "Risk level could not be determined.")
+        return self.RISK_STATEMENTS.get(risk_level, "Risk level could not be determined.")
@@ -5,8 +5,9 @@ Implements proprietary report rendering algorithms.
 Copyright (c) 2026. All rights reserved.
 """
 
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, TextIO
 from datetime import datetime
+from .._common import parallel_map
 from .report_builder import ReportBuilder, Report
 from .template_engine import TemplateEngine
 from .export_handler import ExportHandler, ExportFormat
@@ -30,7 +31,8 @@ class ReportRenderer:
         assessment_data: Dict,
         output_format: str = "text",
         include_recommendations: bool = True,
-        include_evidence: bool = True
+        include_evidence: bool = True,
+        timestamp: Optional[datetime] = None
     ) -> str:
         """
         Render a complete assessment report.
@@ -40,6 +42,8 @@ class ReportRenderer:
             output_format: Output format ("text", "html", "json", "markdown")
             include_recommendations: Include recommendations section
             include_evidence: Include evidence section
+            timestamp: Optional report timestamp, e.g. one shared by a
+                batch export; defaults to the current time
             
         Returns:
             Formatted report string
@@ -48,10 +52,121 @@ class ReportRenderer:
         report = self.builder.build_assessment_report(
             assessment_data,
             include_recommendations,
-            include_evidence
+            include_evidence,
+            timestamp
+        )
+        
+        return self._render_assessment(report, output_format)
+    
+    def render_assessment_report_formats(
+        self,
+        assessment_data: Dict,
+        output_formats: Iterable[str],
+        include_recommendations: bool = True,
+        include_evidence: bool = True,
+        timestamp: Optional[datetime] = None
+    ) -> Dict[str, str]:
+        """
+        Render one assessment report in several formats.
+        
+        The report structure is built once and shared by every format,
+        so all renderings carry the same report timestamp.
+        
+        Args:
+            assessment_data: Assessment data dictionary
+            output_formats: Output formats, as for render_assessment_report
+            include_recommendations: Include recommendations section
+            include_evidence: Include evidence section
+            timestamp: Optional report timestamp; defaults to the current time
+            
+        Returns:
+            Formatted report string for each requested format
+        """
+        report = self.builder.build_assessment_report(
+            assessment_data,
+            include_recommendations,
+            include_evidence,
+            timestamp
+        )
+        
+        return {
+            output_format: self._render_assessment(report, output_format)
+            for output_format in output_formats
+        }
+    
+    def render_assessment_report_to_file(
+        self,
+        assessment_data: Dict,
+        fp: TextIO,
+        output_format: str = "text",
+        include_recommendations: bool = True,
+        include_evidence: bool = True,
+        timestamp: Optional[datetime] = None
+    ):
+        """
+        Render an assessment report straight into an open text file.
+        
+        Writes the same text as render_assessment_report, one section at
+        a time, without building the whole report string in memory.
+        
+        Args:
+            assessment_data: Assessment data dictionary
+            fp: Text file to write to
+            output_format: Output format ("text", "html", "json", "markdown")
+            include_recommendations: Include recommendations section
+            include_evidence: Include evidence section
+            timestamp: Optional report timestamp; defaults to the current time
+        """
+        report = self.builder.build_assessment_report(
+            assessment_data,
+            include_recommendations,
+            include_evidence,
+            timestamp
         )
         
-        # Render using appropriate template
+        if output_format == "html":
+            self.template_engine.write_html(report, fp)
+        elif output_format == "json":
+            self.export_handler.stream_json(report, fp)
+        elif output_format == "markdown":
+            self.template_engine.write_markdown(report, fp)
+        else:  # text
+            self.template_engine.write_text(report, fp)
+    
+    def render_many(
+        self,
+        assessments: List[Dict],
+        output_format: str = "json",
+        n_jobs: Optional[int] = None
+    ) -> List[str]:
+        """
+        Render assessment reports for many venues.
+        
+        Reports are independent, so large batches can be spread over
+        worker processes. Reports are returned in input order and share
+        one batch timestamp.
+        
+        Args:
+            assessments: Assessment data dictionaries, one per venue
+            output_format: Output format, as for render_assessment_report
+            n_jobs: Optional worker process count; batches run serially
+                unless more than one worker is requested
+            
+        Returns:
+            Formatted report strings
+        """
+        return parallel_map(
+            self.render_assessment_report,
+            assessments,
+            output_format,
+            True,  # include_recommendations
+            True,  # include_evidence
+            datetime.now(),
+            n_jobs=n_jobs
+        )
+    
+    def _render_assessment(self, report: Report, output_format: str) -> str:
+        """Render a built assessment report using the appropriate template"""
         if output_format == "html":
             return self.template_engine.render_html(report)
         elif output_format == "json":
@@ -64,7 +179,8 @@ class ReportRenderer:
     def render_comparison_report(
         self,
         comparison_data: Dict,
-        output_format: str = "text"
+        output_format: str = "text",
+        timestamp: Optional[datetime] = None
     ) -> str:
         """
         Render a venue comparison report.
@@ -72,11 +188,12 @@ class ReportRenderer:
         Args:
             comparison_data: Comparison data from credibility engine
             output_format: Output format
+            timestamp: Optional report timestamp; defaults to the current time
             
         Returns:
             Formatted comparison report
         """
-        report = self.builder.build_comparison_report(comparison_data)
+        report = self.builder.build_comparison_report(comparison_data, timestamp)
         
         if output_format == "html":
             return self.template_engine.render_html(report)
@@ -88,7 +205,8 @@ class ReportRenderer:
     def render_compliance_report(
         self,
         compliance_data: Dict,
-        output_format: str = "text"
+        output_format: str = "text",
+        timestamp: Optional[datetime] = None
     ) -> str:
         """
         Render a manuscript compliance report.
@@ -96,11 +214,12 @@ class ReportRenderer:
         Args:
             compliance_data: Compliance compilation report data
             output_format: Output format
+            timestamp: Optional report timestamp; defaults to the current time
             
         Returns:
             Formatted compliance report
         """
-        report = self.builder.build_compliance_report(compliance_data)
+        report = self.builder.build_compliance_report(compliance_data, timestamp)
         
         if output_format == "html":
             return self.template_engine.render_html(report)
@@ -5,7 +5,8 @@ Implements proprietary template rendering algorithms.
 Copyright (c) 2026. All rights reserved.
 """
 
-from typing import Dict
+from itertools import chain
+from typing import Dict, Iterator, List, TextIO
 from .report_builder import Report, ReportSection
 
 
@@ -26,28 +27,37 @@ class TemplateEngine:
         
         Proprietary text formatting algorithm.
         """
-        lines = []
-        
+        return '\n'.join(chain.from_iterable(self._text_blocks(report)))
+    
+    def write_text(self, report: Report, fp: TextIO):
+        """Write report as plain text to an open file, one section at a time"""
+        self._write_blocks(self._text_blocks(report), fp)
+    
+    def _text_blocks(self, report: Report) -> Iterator[List[str]]:
+        """Lines of a plain text report: header, each section, footer"""
         # Header
-        lines.append("=" * 80)
-        lines.append(report.title.center(80))
-        lines.append(report.subtitle.center(80))
-        lines.append(f"Generated: {report.timestamp.strftime('%Y-%m-%d %H:%M:%S')}".center(80))
-        lines.append("=" * 80)
-        lines.append("")
+        yield [
+            "=" * 80,
+            report.title.center(80),
+            report.subtitle.center(80),
+            f"Generated: {report.timestamp.strftime('%Y-%m-%d %H:%M:%S')}".center(80),
+            "=" * 80,
+            ""
+        ]
         
         # Sections
         for section in report.sections:
-            lines.extend(self._render_section_text(section))
+            lines = self._render_section_text(section)
             lines.append("")
+            yield lines
         
         # Footer
-        lines.append("=" * 80)
-        lines.append("ARICCA-X - Automated Research Integrity, Credibility & Compliance Analyzer".center(80))
-        lines.append("Copyright (c) 2026. All rights reserved.".center(80))
-        lines.append("=" * 80)
-        
-        return '\n'.join(lines)
+        yield [
+            "=" * 80,
+            "ARICCA-X - Automated Research Integrity, Credibility & Compliance Analyzer".center(80),
+            "Copyright (c) 2026. All rights reserved.".center(80),
+            "=" * 80
+        ]
     
     def _render_section_text(self, section: ReportSection, indent: int = 0) -> list:
         """Render a section as text"""
@@ -76,28 +86,37 @@ class TemplateEngine:
         
         Proprietary Markdown formatting algorithm.
         """
-        lines = []
-        
+        return '\n'.join(chain.from_iterable(self._markdown_blocks(report)))
+    
+    def write_markdown(self, report: Report, fp: TextIO):
+        """Write report as Markdown to an open file, one section at a time"""
+        self._write_blocks(self._markdown_blocks(report), fp)
+    
+    def _markdown_blocks(self, report: Report) -> Iterator[List[str]]:
+        """Lines of a Markdown report: header, each section, footer"""
         # Header
-        lines.append(f"# {report.title}")
-        lines.append(f"## {report.subtitle}")
-        lines.append(f"*Generated: {report.timestamp.strftime('%Y-%m-%d %H:%M:%S')}*")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        yield [
+            f"# {report.title}",
+            f"## {report.subtitle}",
+            f"*Generated: {report.timestamp.strftime('%Y-%m-%d %H:%M:%S')}*",
+            "",
+            "---",
+            ""
+        ]
         
         # Sections
         for section in report.sections:
-            lines.extend(self._render_section_markdown(section, level=2))
+            lines = self._render_section_markdown(section, level=2)
             lines.append("")
+            yield lines
         
         # Footer
-        lines.append("---")
-        lines.append("*Generated by ARICCA-X - Automated Research Integrity, Credibility & Compliance Analyzer*")
-        lines.append("")
-        lines.append("Copyright (c) 2026. All rights reserved.")
-        
-        return '\n'.join(lines)
+        yield [
+            "---",
+            "*Generated by ARICCA-X - Automated Research Integrity, Credibility & Compliance Analyzer*",
+            "",
+            "Copyright (c) 2026. All rights reserved."
+        ]
     
     def _render_section_markdown(self, section: ReportSection, level: int = 2) -> list:
         """Render a section as Markdown"""
@@ -125,43 +144,48 @@ class TemplateEngine:
         
         Proprietary HTML template.
         """
-        html_parts = []
-        
-        # HTML header
-        html_parts.append("<!DOCTYPE html>")
-        html_parts.append("<html lang='en'>")
-        html_parts.append("<head>")
-        html_parts.append("  <meta charset='UTF-8'>")
-        html_parts.append(f"  <title>{report.title}</title>")
-        html_parts.append("  <style>")
-        html_parts.append(self._get_css_styles())
-        html_parts.append("  </style>")
-        html_parts.append("</head>")
-        html_parts.append("<body>")
-        
-        # Report header
-        html_parts.append("  <div class='header'>")
-        html_parts.append(f"    <h1>{report.title}</h1>")
-        html_parts.append(f"    <h2>{report.subtitle}</h2>")
-        html_parts.append(f"    <p class='timestamp'>Generated: {report.timestamp.strftime('%Y-%m-%d %H:%M:%S')}</p>")
-        html_parts.append("  </div>")
+        return '\n'.join(chain.from_iterable(self._html_blocks(report)))
+    
+    def write_html(self, report: Report, fp: TextIO):
+        """Write report as HTML to an open file, one section at a time"""
+        self._write_blocks(self._html_blocks(report), fp)
+    
+    def _html_blocks(self, report: Report) -> Iterator[List[str]]:
+        """Lines of an HTML report: header, each section, footer"""
+        # HTML header and report header, opening the report content
+        yield [
+            "<!DOCTYPE html>",
+            "<html lang='en'>",
+            "<head>",
+            "  <meta charset='UTF-8'>",
+            f"  <title>{report.title}</title>",
+            "  <style>",
+            self._get_css_styles(),
+            "  </style>",
+            "</head>",
+            "<body>",
+            "  <div class='header'>",
+            f"    <h1>{report.title}</h1>",
+            f"    <h2>{report.subtitle}</h2>",
+            f"    <p class='timestamp'>Generated: {report.timestamp.strftime('%Y-%m-%d %H:%M:%S')}</p>",
+            "  </div>",
+            "  <div class='content'>"
+        ]
         
         # Report content
-        html_parts.append("  <div class='content'>")
         for section in report.sections:
-            html_parts.extend(self._render_section_html(section))
-        html_parts.append("  </div>")
+            yield self._render_section_html(section)
         
         # Footer
-        html_parts.append("  <div class='footer'>")
-        html_parts.append("    <p>ARICCA-X - Automated Research Integrity, Credibility & Compliance Analyzer</p>")
-        html_parts.append("    <p>Copyright (c) 2026. All rights reserved.</p>")
-        html_parts.append("  </div>")
-        
-        html_parts.append("</body>")
-        html_parts.append("</html>")
-        
-        return '\n'.join(html_parts)
+        yield [
+            "  </div>",
+            "  <div class='footer'>",
+            "    <p>ARICCA-X - Automated Research Integrity, Credibility & Compliance Analyzer</p>",
+            "    <p>Copyright (c) 2026. All rights reserved.</p>",
+            "  </div>",
+            "</body>",
+            "</html>"
+        ]
     
     def _render_section_html(self, section: ReportSection, level: int = 3) -> list:
         """Render a section as HTML"""
@@ -181,6 +205,14 @@ class TemplateEngine:
         
         return html
     
+    def _write_blocks(self, blocks: Iterator[List[str]], fp: TextIO):
+        """Write blocks of lines as newline-separated text, one block at a time"""
+        separator = ''
+        for block in blocks:
+            fp.write(separator)
+            fp.write('\n'.join(block))
+            separator = '\n'
+    
     def _get_css_styles(self) -> str:
         """Get proprietary CSS styles for HTML reports"""
         return """
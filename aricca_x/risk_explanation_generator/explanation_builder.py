@@ -5,11 +5,13 @@ Implements proprietary explanation generation templates.
 Copyright (c) 2026. All rights reserved.
 """
 
+from bisect import bisect_right
 from typing import Dict
 from dataclasses import dataclass
+from .._common import MISSING
 
 
-@dataclass
+@dataclass(slots=True)
 class Explanation:
     """Structured explanation"""
     summary: str
@@ -48,6 +50,11 @@ class ExplanationBuilder:
         }
     }
     
+    # Natural-language level for a 0-1 score: each boundary starts the
+    # next label, so a score of exactly 0.25 is "Low"
+    _LEVEL_BOUNDARIES = (0.25, 0.50, 0.75)
+    _LEVEL_LABELS = ("Very Low", "Low", "Moderate", "High")
+    
     def __init__(self):
         """Initialize the explanation builder"""
         pass
@@ -83,73 +90,55 @@ class ExplanationBuilder:
         risk_level = assessment_data.get('risk_level', 'medium')
         template = self.RISK_TEMPLATES.get(risk_level, self.RISK_TEMPLATES['medium'])
         
-        explanation_parts = []
-        
-        # Introduction
-        explanation_parts.append(template['intro'])
-        explanation_parts.append("")
-        
-        # Analysis details
-        explanation_parts.append("ANALYSIS BREAKDOWN:")
+        # Introduction and analysis details
+        explanation_parts = [template['intro'], "", "ANALYSIS BREAKDOWN:"]
         
         # Component scores
         components = assessment_data.get('score_components', {})
-        if hasattr(components, 'cfp_risk_score'):
-            risk_desc = self._describe_risk_level(components.cfp_risk_score)
+        cfp_risk = getattr(components, 'cfp_risk_score', MISSING)
+        if cfp_risk is not MISSING:
+            risk_desc = self._describe_risk_level(cfp_risk)
             explanation_parts.append(
-                f"• Call for Papers Risk: {risk_desc} ({components.cfp_risk_score:.2f})"
+                f"• Call for Papers Risk: {risk_desc} ({cfp_risk:.2f})"
             )
         
-        if hasattr(components, 'website_credibility_score'):
-            cred_desc = self._describe_credibility_level(components.website_credibility_score)
+        website_cred = getattr(components, 'website_credibility_score', MISSING)
+        if website_cred is not MISSING:
+            cred_desc = self._describe_credibility_level(website_cred)
             explanation_parts.append(
-                f"• Website Credibility: {cred_desc} ({components.website_credibility_score:.2f})"
+                f"• Website Credibility: {cred_desc} ({website_cred:.2f})"
             )
         
-        if hasattr(components, 'indexing_credibility_score'):
-            cred_desc = self._describe_credibility_level(components.indexing_credibility_score)
+        indexing_cred = getattr(components, 'indexing_credibility_score', MISSING)
+        if indexing_cred is not MISSING:
+            cred_desc = self._describe_credibility_level(indexing_cred)
             explanation_parts.append(
-                f"• Indexing Claims: {cred_desc} ({components.indexing_credibility_score:.2f})"
+                f"• Indexing Claims: {cred_desc} ({indexing_cred:.2f})"
             )
         
         explanation_parts.append("")
         
         # Heuristic results
         heuristic_results = assessment_data.get('heuristic_results', [])
-        failed_heuristics = [h for h in heuristic_results if hasattr(h, 'passed') and not h.passed]
+        failed_heuristics = [h for h in heuristic_results if not getattr(h, 'passed', True)]
         
         if failed_heuristics:
             explanation_parts.append("FAILED CREDIBILITY CHECKS:")
-            for h in failed_heuristics[:5]:  # Top 5
-                explanation_parts.append(f"• {h.name}: {h.description}")
+            explanation_parts.extend(
+                f"• {h.name}: {h.description}" for h in failed_heuristics[:5]  # Top 5
+            )
         else:
             explanation_parts.append("All credibility checks passed successfully.")
         
-        explanation_parts.append("")
-        
         # Conclusion
-        explanation_parts.append(template['conclusion'])
+        explanation_parts += ("", template['conclusion'])
         
         return '\n'.join(explanation_parts)
     
     def _describe_risk_level(self, score: float) -> str:
         """Describe risk level in natural language"""
-        if score < 0.25:
-            return "Very Low"
-        elif score < 0.50:
-            return "Low"
-        elif score < 0.75:
-            return "Moderate"
-        else:
-            return "High"
+        return self._LEVEL_LABELS[bisect_right(self._LEVEL_BOUNDARIES, score)]
     
     def _describe_credibility_level(self, score: float) -> str:
         """Describe credibility level in natural language"""
-        if score < 0.25:
-            return "Very Low"
-        elif score < 0.50:
-            return "Low"
-        elif score < 0.75:
-            return "Moderate"
-        else:
-            return "High"
+        return self._LEVEL_LABELS[bisect_right(self._LEVEL_BOUNDARIES, score)]
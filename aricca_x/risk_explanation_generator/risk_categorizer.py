@@ -5,9 +5,11 @@ Implements proprietary risk categorization algorithms.
 Copyright (c) 2026. All rights reserved.
 """
 
+import re
 from typing import Dict, List
 from dataclasses import dataclass
 from enum import Enum
+from .._common import MISSING
 
 
 class RiskType(Enum):
@@ -19,7 +21,7 @@ class RiskType(Enum):
     ETHICAL = "ethical"
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskCategory:
     """Categorized risk information"""
     primary_risk_type: RiskType
@@ -35,6 +37,52 @@ class RiskCategorizer:
     Uses proprietary risk classification algorithms.
     """
     
+    # Financial keywords, matched against lowercased flag text
+    _FINANCIAL_KEYWORDS = re.compile(r'fee|payment')
+    
+    # Risk description for each risk type and level
+    RISK_DESCRIPTIONS = {
+        RiskType.FINANCIAL: {
+            'low': "Minimal financial risk - fees appear standard",
+            'medium': "Moderate financial risk - verify fee structure",
+            'high': "High financial risk - questionable fee practices",
+            'critical': "Critical financial risk - likely predatory fees"
+        },
+        RiskType.REPUTATIONAL: {
+            'low': "Minimal reputational risk - venue appears credible",
+            'medium': "Moderate reputational risk - mixed credibility signals",
+            'high': "High reputational risk - venue shows predatory indicators",
+            'critical': "Critical reputational risk - publishing here may harm your career"
+        },
+        RiskType.TIME: {
+            'low': "Minimal time risk - standard publishing process expected",
+            'medium': "Moderate time risk - review process may be problematic",
+            'high': "High time risk - significant delays or issues likely",
+            'critical': "Critical time risk - likely to waste substantial time"
+        },
+        RiskType.CAREER: {
+            'low': "Minimal career risk - venue meets academic standards",
+            'medium': "Moderate career risk - venue acceptance may vary",
+            'high': "High career risk - venue may not be recognized",
+            'critical': "Critical career risk - publication may be dismissed or penalized"
+        },
+        RiskType.ETHICAL: {
+            'low': "Minimal ethical concerns - venue follows academic standards",
+            'medium': "Moderate ethical concerns - some questionable practices",
+            'high': "High ethical concerns - predatory characteristics present",
+            'critical': "Critical ethical concerns - venue clearly violates academic ethics"
+        }
+    }
+    
+    # Areas affected by each risk type
+    AFFECTED_AREAS = {
+        RiskType.FINANCIAL: ("Publication fees", "Registration costs", "Hidden charges"),
+        RiskType.REPUTATIONAL: ("Academic reputation", "CV quality", "Future citations"),
+        RiskType.TIME: ("Research time", "Publication timeline", "Career progression"),
+        RiskType.CAREER: ("Tenure evaluation", "Grant applications", "Academic recognition"),
+        RiskType.ETHICAL: ("Academic integrity", "Institutional reputation", "Research ethics")
+    }
+    
     def __init__(self):
         """Initialize the risk categorizer"""
         pass
@@ -73,75 +121,32 @@ class RiskCategorizer:
         components = assessment_data.get('score_components', {})
         
         # Check for financial risk indicators
+        # One scan over all flags, joined so a keyword cannot span two flags
         flags = assessment_data.get('flags', [])
-        financial_flags = sum(1 for f in flags if 'fee' in f.lower() or 'payment' in f.lower())
+        has_financial_flag = (
+            self._FINANCIAL_KEYWORDS.search('\n'.join(flags).lower()) is not None
+        )
         
-        if financial_flags > 0:
+        if has_financial_flag:
             return RiskType.FINANCIAL
         
         # Check for reputational risk
-        if hasattr(components, 'indexing_credibility_score'):
-            if components.indexing_credibility_score < 0.4:
-                return RiskType.REPUTATIONAL
+        indexing_cred = getattr(components, 'indexing_credibility_score', MISSING)
+        if indexing_cred is not MISSING and indexing_cred < 0.4:
+            return RiskType.REPUTATIONAL
         
         # Check for time waste risk
-        if hasattr(components, 'cfp_risk_score'):
-            if components.cfp_risk_score > 0.7:
-                return RiskType.TIME
+        cfp_risk = getattr(components, 'cfp_risk_score', MISSING)
+        if cfp_risk is not MISSING and cfp_risk > 0.7:
+            return RiskType.TIME
         
         # Default to reputational risk
         return RiskType.REPUTATIONAL
     
     def _generate_risk_description(self, risk_type: RiskType, risk_level: str) -> str:
         """Generate description of the risk"""
-        descriptions = {
-            RiskType.FINANCIAL: {
-                'low': "Minimal financial risk - fees appear standard",
-                'medium': "Moderate financial risk - verify fee structure",
-                'high': "High financial risk - questionable fee practices",
-                'critical': "Critical financial risk - likely predatory fees"
-            },
-            RiskType.REPUTATIONAL: {
-                'low': "Minimal reputational risk - venue appears credible",
-                'medium': "Moderate reputational risk - mixed credibility signals",
-                'high': "High reputational risk - venue shows predatory indicators",
-                'critical': "Critical reputational risk - publishing here may harm your career"
-            },
-            RiskType.TIME: {
-                'low': "Minimal time risk - standard publishing process expected",
-                'medium': "Moderate time risk - review process may be problematic",
-                'high': "High time risk - significant delays or issues likely",
-                'critical': "Critical time risk - likely to waste substantial time"
-            },
-            RiskType.CAREER: {
-                'low': "Minimal career risk - venue meets academic standards",
-                'medium': "Moderate career risk - venue acceptance may vary",
-                'high': "High career risk - venue may not be recognized",
-                'critical': "Critical career risk - publication may be dismissed or penalized"
-            },
-            RiskType.ETHICAL: {
-                'low': "Minimal ethical concerns - venue follows academic standards",
-                'medium': "Moderate ethical concerns - some questionable practices",
-                'high': "High ethical concerns - predatory characteristics present",
-                'critical': "Critical ethical concerns - venue clearly violates academic ethics"
-            }
-        }
-        
-        return descriptions.get(risk_type, {}).get(risk_level, "Unknown risk level")
+        return self.RISK_DESCRIPTIONS.get(risk_type, {}).get(risk_level, "Unknown risk level")
     
     def _identify_affected_areas(self, assessment_data: Dict, risk_type: RiskType) -> List[str]:
         """Identify areas affected by the risk"""
-        affected = []
-        
-        if risk_type == RiskType.FINANCIAL:
-            affected.extend(["Publication fees", "Registration costs", "Hidden charges"])
-        elif risk_type == RiskType.REPUTATIONAL:
-            affected.extend(["Academic reputation", "CV quality", "Future citations"])
-        elif risk_type == RiskType.TIME:
-            affected.extend(["Research time", "Publication timeline", "Career progression"])
-        elif risk_type == RiskType.CAREER:
-            affected.extend(["Tenure evaluation", "Grant applications", "Academic recognition"])
-        elif risk_type == RiskType.ETHICAL:
-            affected.extend(["Academic integrity", "Institutional reputation", "Research ethics"])
-        
-        return affected
+        return list(self.AFFECTED_AREAS.get(risk_type, ()))
@@ -7,11 +7,12 @@ Copyright (c) 2026. All rights reserved.
 
 from typing import Dict, List, Optional
 from dataclasses import dataclass
+from .._common import MISSING
 from .explanation_builder import ExplanationBuilder, Explanation
 from .risk_categorizer import RiskCategorizer, RiskCategory
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskExplanation:
     """Complete risk explanation"""
     summary: str
@@ -30,6 +31,11 @@ class RiskExplanationGenerator:
     Implements proprietary natural language generation for risk communication.
     """
     
+    # Risk levels that call for looking at alternative venues, and those
+    # that call for independent verification of the venue's claims
+    _HIGH_RISK_LEVELS = frozenset({'high', 'critical'})
+    _VERIFY_RISK_LEVELS = frozenset({'medium', 'high', 'critical'})
+    
     def __init__(self):
         """Initialize the risk explanation generator"""
         self.builder = ExplanationBuilder()
@@ -38,7 +44,8 @@ class RiskExplanationGenerator:
     def generate_explanation(
         self,
         assessment_data: Dict,
-        target_audience: str = "researcher"
+        target_audience: str = "researcher",
+        include_detailed: bool = True
     ) -> RiskExplanation:
         """
         Generate comprehensive risk explanation.
@@ -46,6 +53,8 @@ class RiskExplanationGenerator:
         Args:
             assessment_data: Credibility assessment data
             target_audience: "researcher", "administrator", or "general"
+            include_detailed: Build the detailed explanation; callers that
+                only show summaries can skip it, leaving it empty
             
         Returns:
             RiskExplanation object
@@ -61,7 +70,7 @@ class RiskExplanationGenerator:
             assessment_data,
             risk_category,
             target_audience
-        )
+        ) if include_detailed else ""
         
         # Extract risk factors
         risk_factors = self._extract_risk_factors(assessment_data)
@@ -96,25 +105,25 @@ class RiskExplanationGenerator:
         components = assessment_data.get('score_components', {})
         
         # Check CFP risk
-        if hasattr(components, 'cfp_risk_score'):
-            if components.cfp_risk_score > 0.6:
-                factors.append(
-                    f"High-risk CFP indicators (score: {components.cfp_risk_score:.2f})"
-                )
+        cfp_risk = getattr(components, 'cfp_risk_score', MISSING)
+        if cfp_risk is not MISSING and cfp_risk > 0.6:
+            factors.append(
+                f"High-risk CFP indicators (score: {cfp_risk:.2f})"
+            )
         
         # Check website credibility
-        if hasattr(components, 'website_credibility_score'):
-            if components.website_credibility_score < 0.4:
-                factors.append(
-                    f"Low website credibility (score: {components.website_credibility_score:.2f})"
-                )
+        website_cred = getattr(components, 'website_credibility_score', MISSING)
+        if website_cred is not MISSING and website_cred < 0.4:
+            factors.append(
+                f"Low website credibility (score: {website_cred:.2f})"
+            )
         
         # Check indexing credibility
-        if hasattr(components, 'indexing_credibility_score'):
-            if components.indexing_credibility_score < 0.5:
-                factors.append(
-                    f"Questionable indexing claims (score: {components.indexing_credibility_score:.2f})"
-                )
+        indexing_cred = getattr(components, 'indexing_credibility_score', MISSING)
+        if indexing_cred is not MISSING and indexing_cred < 0.5:
+            factors.append(
+                f"Questionable indexing claims (score: {indexing_cred:.2f})"
+            )
         
         # Check flags
         flags = assessment_data.get('flags', [])
@@ -132,7 +141,7 @@ class RiskExplanationGenerator:
         
         risk_level = assessment_data.get('risk_level', 'medium')
         
-        if risk_level in ['high', 'critical']:
+        if risk_level in self._HIGH_RISK_LEVELS:
             strategies.append(
                 "Consider alternative venues: Look for venues with verified "
                 "indexing and established reputation."
@@ -142,7 +151,7 @@ class RiskExplanationGenerator:
                 "in your field."
             )
         
-        if risk_level in ['medium', 'high', 'critical']:
+        if risk_level in self._VERIFY_RISK_LEVELS:
             strategies.append(
                 "Independent verification: Verify all claims (indexing, impact factor, "
                 "etc.) through official databases."
@@ -165,12 +174,14 @@ class RiskExplanationGenerator:
         # Collect heuristic evidence
         heuristic_results = assessment_data.get('heuristic_results', [])
         for result in heuristic_results:
-            if hasattr(result, 'evidence') and not result.passed:
-                evidence.extend(result.evidence)
+            result_evidence = getattr(result, 'evidence', MISSING)
+            if result_evidence is not MISSING and not result.passed:
+                evidence.extend(result_evidence)
         
         # Collect component evidence
         components = assessment_data.get('score_components', {})
-        if hasattr(components, 'cfp_risk_score') and components.cfp_risk_score > 0.7:
+        cfp_risk = getattr(components, 'cfp_risk_score', MISSING)
+        if cfp_risk is not MISSING and cfp_risk > 0.7:
             evidence.append("CFP contains multiple predatory indicators")
         
         return evidence[:10]  # Limit to top 10
@@ -6,12 +6,20 @@ Copyright (c) 2026. All rights reserved.
 """
 
 import hashlib
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass, field
+from array import array
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set, Tuple
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from .._common import LRUCache, freeze
 
 
-@dataclass
+# Shared stand-in for missing data sources; read-only, so it is never
+# mutated through one caller and seen by another
+_EMPTY: Mapping = MappingProxyType({})
+
+
+@dataclass(slots=True)
 class VenueFingerprint:
     """
     Structured fingerprint of an academic venue.
@@ -65,12 +73,41 @@ class FingerprintGenerator:
     characterizing research venues based on multiple data sources.
     """
     
-    def __init__(self):
-        """Initialize the fingerprint generator"""
+    # Fingerprint confidence for each combination of available data, indexed
+    # by cfp | website << 1 | organizer << 2. Each entry sums 0.4 (CFP),
+    # 0.4 (website) and 0.2 (organizer) in that order, so the values match
+    # accumulating them one at a time.
+    _CONFIDENCE_TABLE = (
+        0.0,
+        0.4,
+        0.4,
+        0.4 + 0.4,
+        0.2,
+        0.4 + 0.2,
+        0.4 + 0.2,
+        0.4 + 0.4 + 0.2
+    )
+    
+    # Page and section names looked for in website structure
+    _EXPECTED_PAGES = ('about', 'committee', 'submission', 'program', 'contact')
+    _REQUIRED_SECTIONS = ('about', 'dates', 'submission', 'contact')
+    
+    def __init__(self, cache_size: int = 0):
+        """
+        Initialize the fingerprint generator.
+        
+        Args:
+            cache_size: Number of recent fingerprints to keep for venues
+                fingerprinted again with identical data. Keying costs
+                roughly a third of a fingerprint, so caching is off by
+                default and only pays off for repeat-heavy workloads.
+        """
         self.known_indexers = {
             'scopus', 'web of science', 'ieee xplore', 'acm digital library',
             'pubmed', 'google scholar', 'dblp', 'arxiv', 'springer', 'elsevier'
         }
+        self.cache_size = cache_size
+        self._fingerprint_cache = LRUCache(cache_size)
     
     def generate_fingerprint(
         self,
@@ -78,7 +115,8 @@ class FingerprintGenerator:
         venue_type: str,
         cfp_data: Optional[Dict] = None,
         website_data: Optional[Dict] = None,
-        organizer_data: Optional[Dict] = None
+        organizer_data: Optional[Dict] = None,
+        timestamp: Optional[datetime] = None
     ) -> VenueFingerprint:
         """
         Generate a comprehensive venue fingerprint.
@@ -89,38 +127,96 @@ class FingerprintGenerator:
             cfp_data: Optional CFP analysis data
             website_data: Optional website analysis data
             organizer_data: Optional organizer information
+            timestamp: Optional generation time (defaults to now)
             
         Returns:
             VenueFingerprint object
         """
+        timestamp = timestamp or datetime.now()
+        if not self.cache_size:
+            return self._generate(
+                venue_name, venue_type, cfp_data, website_data, organizer_data, timestamp
+            )
+        
+        try:
+            # known_indexers is public, so it is part of the key too
+            key = freeze((
+                venue_name, venue_type, cfp_data, website_data, organizer_data
+            )), frozenset(self.known_indexers)
+        except TypeError:
+            # Unhashable data: generate without caching
+            return self._generate(
+                venue_name, venue_type, cfp_data, website_data, organizer_data, timestamp
+            )
+        
+        cache = self._fingerprint_cache
+        fingerprint = cache.get(key)
+        if fingerprint is None:
+            fingerprint = self._generate(
+                venue_name, venue_type, cfp_data, website_data, organizer_data, timestamp
+            )
+            cache.put(key, fingerprint)
+        
+        # The cached fingerprint stays private: copy every mutable field
+        return replace(
+            fingerprint,
+            urgency_indicators=list(fingerprint.urgency_indicators),
+            claimed_indexers=list(fingerprint.claimed_indexers),
+            indexing_verification_status=dict(fingerprint.indexing_verification_status),
+            organizer_names=list(fingerprint.organizer_names),
+            institutional_affiliations=list(fingerprint.institutional_affiliations),
+            historical_venues=list(fingerprint.historical_venues),
+            generation_timestamp=timestamp,
+            contact_legitimacy_indicators=dict(fingerprint.contact_legitimacy_indicators),
+            suspicious_patterns=list(fingerprint.suspicious_patterns),
+            positive_signals=list(fingerprint.positive_signals)
+        )
+    
+    def _generate(
+        self,
+        venue_name: str,
+        venue_type: str,
+        cfp_data: Optional[Dict],
+        website_data: Optional[Dict],
+        organizer_data: Optional[Dict],
+        timestamp: datetime
+    ) -> VenueFingerprint:
+        """Generate a venue fingerprint without consulting the cache"""
         # Generate unique venue ID
         venue_id = self._generate_venue_id(venue_name, venue_type)
         
+        # Missing data sources read as empty, so their defaults apply
+        cfp = cfp_data or _EMPTY
+        website = website_data or _EMPTY
+        organizer = organizer_data or _EMPTY
+        
         # Process CFP data
-        cfp_signature = self._generate_cfp_signature(cfp_data or {})
-        cfp_risk = cfp_data.get('overall_cfp_risk', 0.5) if cfp_data else 0.5
-        urgency = cfp_data.get('urgency_indicators', []) if cfp_data else []
+        cfp_signature = self._generate_cfp_signature(cfp)
+        cfp_risk = cfp.get('overall_cfp_risk', 0.5)
+        urgency = cfp.get('urgency_indicators', [])
         
-        # Process website data
-        website_depth = self._calculate_website_depth(website_data or {})
-        domain_age = website_data.get('domain_age') if website_data else None
-        structural_score = self._calculate_structural_completeness(website_data or {})
+        # Process website data; page names are lowercased once for the
+        # depth and contact checks
+        page_text = self._lowered_names(website.get('pages', []))
+        website_depth = self._calculate_website_depth(website, page_text)
+        domain_age = website.get('domain_age')
+        structural_score = self._calculate_structural_completeness(website)
         
         # Process indexing claims
-        claimed_indexers = self._extract_indexing_claims(cfp_data or {}, website_data or {})
+        claimed_indexers = self._extract_indexing_claims(cfp, website)
         verification_status = self._verify_indexing_claims(claimed_indexers)
         
         # Process organizer data
-        organizers = organizer_data.get('names', []) if organizer_data else []
+        organizers = organizer.get('names', [])
         recurrence = self._calculate_organizer_recurrence(organizers)
-        affiliations = organizer_data.get('affiliations', []) if organizer_data else []
+        affiliations = organizer.get('affiliations', [])
         
         # Extract patterns
         suspicious = self._identify_suspicious_patterns(cfp_data, website_data, organizer_data)
         positive = self._identify_positive_signals(cfp_data, website_data, organizer_data)
         
         # Calculate contact legitimacy
-        contact_indicators = self._analyze_contact_legitimacy(cfp_data or {}, website_data or {})
+        contact_indicators = self._analyze_contact_legitimacy(cfp, website, page_text)
         
         # Generate fingerprint hash
         fingerprint_hash = self._generate_fingerprint_hash(
@@ -150,19 +246,76 @@ class FingerprintGenerator:
             publication_frequency=None,
             historical_venues=[],
             fingerprint_hash=fingerprint_hash,
-            generation_timestamp=datetime.now(),
+            generation_timestamp=timestamp,
             confidence_score=confidence,
             contact_legitimacy_indicators=contact_indicators,
             suspicious_patterns=suspicious,
             positive_signals=positive
         )
     
+    def generate_fingerprints(self, venues: List[Dict]) -> List[VenueFingerprint]:
+        """
+        Generate fingerprints for multiple venues.
+        
+        Fingerprints are returned in input order and share one
+        generation timestamp.
+        
+        Args:
+            venues: Venue dictionaries with 'venue_name' and 'venue_type',
+                and optional 'cfp_data', 'website_data' and 'organizer_data'
+            
+        Returns:
+            List of VenueFingerprint objects
+        """
+        timestamp = datetime.now()
+        return [
+            self.generate_fingerprint(
+                venue['venue_name'],
+                venue['venue_type'],
+                venue.get('cfp_data'),
+                venue.get('website_data'),
+                venue.get('organizer_data'),
+                timestamp
+            )
+            for venue in venues
+        ]
+    
+    def calculate_scores_batch(
+        self,
+        cfp_list: List[Optional[Dict]],
+        website_list: List[Optional[Dict]],
+        organizer_list: List[Optional[Dict]]
+    ) -> Tuple[array, array, array]:
+        """
+        Calculate the numeric fingerprint scores for many venues at once.
+        
+        Scores each column in one pass without building a fingerprint
+        per venue. Each venue's values match generate_fingerprint.
+        
+        Args:
+            cfp_list: CFP data, one entry per venue
+            website_list: Website data, one entry per venue
+            organizer_list: Organizer data, one entry per venue
+            
+        Returns:
+            (website_depth, structural_completeness, confidence) arrays
+            in venue order
+        """
+        websites = [website_data or _EMPTY for website_data in website_list]
+        depth = array('d', map(self._calculate_website_depth, websites))
+        completeness = array('d', map(self._calculate_structural_completeness, websites))
+        confidence = array('d', map(
+            self._calculate_fingerprint_confidence, cfp_list, website_list, organizer_list
+        ))
+        
+        return depth, completeness, confidence
+    
     def _generate_venue_id(self, venue_name: str, venue_type: str) -> str:
         """Generate unique venue identifier"""
         normalized = f"{venue_type}:{venue_name.lower().strip()}"
         return hashlib.sha256(normalized.encode()).hexdigest()[:16]
     
-    def _generate_cfp_signature(self, cfp_data: Dict) -> str:
+    def _generate_cfp_signature(self, cfp_data: Mapping) -> str:
         """
         Generate a unique CFP syntax signature.
         
@@ -184,11 +337,16 @@ class FingerprintGenerator:
         signature_string = "|".join(components)
         return hashlib.md5(signature_string.encode()).hexdigest()[:12]
     
-    def _calculate_website_depth(self, website_data: Dict) -> float:
+    def _calculate_website_depth(
+        self,
+        website_data: Mapping,
+        page_text: Optional[str] = None
+    ) -> float:
         """
         Calculate website structural depth score.
         
         Proprietary scoring algorithm based on website architecture.
+        page_text is the lowered page names, when the caller has them.
         """
         if not website_data:
             return 0.0
@@ -196,11 +354,11 @@ class FingerprintGenerator:
         score = 0.0
         
         # Check for key pages
-        key_pages = website_data.get('pages', [])
-        expected_pages = {'about', 'committee', 'submission', 'program', 'contact'}
+        if page_text is None:
+            page_text = self._lowered_names(website_data.get('pages', []))
         
-        for page in expected_pages:
-            if any(page in p.lower() for p in key_pages):
+        for page in self._EXPECTED_PAGES:
+            if page in page_text:
                 score += 0.15
         
         # Check navigation depth
@@ -210,7 +368,7 @@ class FingerprintGenerator:
         
         return min(score, 1.0)
     
-    def _calculate_structural_completeness(self, website_data: Dict) -> float:
+    def _calculate_structural_completeness(self, website_data: Mapping) -> float:
         """
         Calculate structural completeness of venue website.
         
@@ -222,11 +380,10 @@ class FingerprintGenerator:
         completeness = 0.0
         
         # Check for required sections
-        sections = website_data.get('sections', [])
-        required = ['about', 'dates', 'submission', 'contact']
+        section_text = self._lowered_names(website_data.get('sections', []))
         
-        for req in required:
-            if any(req in s.lower() for s in sections):
+        for req in self._REQUIRED_SECTIONS:
+            if req in section_text:
                 completeness += 0.2
         
         # Check for SSL/HTTPS
@@ -239,23 +396,27 @@ class FingerprintGenerator:
         
         return min(completeness, 1.0)
     
-    def _extract_indexing_claims(self, cfp_data: Dict, website_data: Dict) -> List[str]:
-        """Extract indexing claims from CFP and website data"""
-        claims = set()
+    def _lowered_names(self, names: List[str]) -> str:
+        """
+        Lowercase page or section names into one newline-separated string.
         
-        # From CFP text
+        A name without a newline is in the result exactly when it is a
+        substring of one of the names, so each probe is a single scan
+        instead of lowercasing every name again.
+        """
+        return '\n'.join(names).lower()
+    
+    def _extract_indexing_claims(self, cfp_data: Mapping, website_data: Mapping) -> List[str]:
+        """Extract indexing claims from CFP and website data"""
+        # Substring search on the lowercased text runs in C and beats a
+        # combined regex scan, so each indexer is a plain 'in' check
         cfp_text = cfp_data.get('cfp_text', '').lower()
-        for indexer in self.known_indexers:
-            if indexer in cfp_text:
-                claims.add(indexer.title())
-        
-        # From website
         website_text = website_data.get('full_text', '').lower()
-        for indexer in self.known_indexers:
-            if indexer in website_text:
-                claims.add(indexer.title())
         
-        return sorted(list(claims))
+        return sorted(
+            indexer.title() for indexer in self.known_indexers
+            if indexer in cfp_text or indexer in website_text
+        )
     
     def _verify_indexing_claims(self, claimed_indexers: List[str]) -> Dict[str, str]:
         """
@@ -337,8 +498,17 @@ class FingerprintGenerator:
         
         return signals
     
-    def _analyze_contact_legitimacy(self, cfp_data: Dict, website_data: Dict) -> Dict[str, float]:
-        """Analyze legitimacy of contact information"""
+    def _analyze_contact_legitimacy(
+        self,
+        cfp_data: Mapping,
+        website_data: Mapping,
+        page_text: Optional[str] = None
+    ) -> Dict[str, float]:
+        """
+        Analyze legitimacy of contact information.
+        
+        page_text is the lowered page names, when the caller has them.
+        """
         indicators = {}
         
         # Email domain analysis
@@ -350,7 +520,9 @@ class FingerprintGenerator:
             indicators['academic_email_ratio'] = 0.0
         
         # Contact page presence
-        has_contact_page = any('contact' in p.lower() for p in website_data.get('pages', []))
+        if page_text is None:
+            page_text = self._lowered_names(website_data.get('pages', []))
+        has_contact_page = 'contact' in page_text
         indicators['has_contact_page'] = 1.0 if has_contact_page else 0.0
         
         return indicators
@@ -382,13 +554,6 @@ class FingerprintGenerator:
         organizer_data: Optional[Dict]
     ) -> float:
         """Calculate overall fingerprint confidence score"""
-        confidence = 0.0
-        
-        if cfp_data:
-            confidence += 0.4
-        if website_data:
-            confidence += 0.4
-        if organizer_data:
-            confidence += 0.2
-        
-        return confidence
+        return self._CONFIDENCE_TABLE[
+            bool(cfp_data) | bool(website_data) << 1 | bool(organizer_data) << 2
+        ]
@@ -6,9 +6,11 @@ Copyright (c) 2026. All rights reserved.
 """
 
 import re
-from typing import Dict, List, Set, Tuple
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from .._common import LRUCache, parallel_map
 
 
 class ClaimVeracity(Enum):
@@ -74,18 +76,69 @@ class IndexingClaimDetector:
         r'currently\s+indexed\s+(?:by|in)'
     ]
     
+    # Vague coverage terms, matched against lowercased claim text
+    VAGUE_TERMS = (
+        'many databases', 'various indexers', 'several indexes',
+        'well known', 'reputed', 'leading'
+    )
+    
+    # Explicit indexing language, matched against lowercased claim text
+    INDEXING_WORDS = ('indexed', 'indexing', 'abstracted', 'covered', 'included')
+    
+    # Keywords the identifier_number pattern starts with
+    _IDENTIFIER_WORDS = ('issn', 'isbn', 'doi')
+    
+    # Future tense phrasing, which indicates uncertainty
+    FUTURE_PHRASINGS = [r'\bwill\s+be\b', r'\bplanning\s+to\b', r'\baiming\s+to\b']
+    
+    # Claim detail patterns, compiled once rather than looked up per claim
+    _COMPILED = {
+        'year': re.compile(r'\b\d{4}\b'),
+        'identifier_number': re.compile(r'(?:issn|isbn|doi)[\s:]*[\d-]+', re.IGNORECASE),
+        'id': re.compile(r'(?:id|identifier)[\s:]*[\w\d-]+', re.IGNORECASE),
+        'since_year': re.compile(r'since\s+\d{4}', re.IGNORECASE),
+        'issn': re.compile(r'issn[\s:]*(\d{4}-\d{3}[\dxX])', re.IGNORECASE),
+        'indexed_from': re.compile(r'(?:since|from)\s+(\d{4})', re.IGNORECASE),
+        'url': re.compile(r'https?://[\w.-]+'),
+    }
+    
+    # Claim contexts whose scores each detector keeps
+    _CONTEXT_CACHE_SIZE = 4096
+    
     def __init__(self):
         """Initialize the indexing claim detector"""
         self.all_indexers = set()
         for tier_indexers in self.KNOWN_INDEXERS.values():
             self.all_indexers.update(indexer.lower() for indexer in tier_indexers)
         
+        # Title-cased names claims are reported under, and a whole-word,
+        # case-insensitive pattern for each, compiled once
+        indexers = list(self.all_indexers)
+        self._indexer_titles = [indexer.title() for indexer in indexers]
+        self._mention_patterns = {
+            indexer.title(): re.compile(r'\b' + re.escape(indexer) + r'\b', re.IGNORECASE)
+            for indexer in indexers
+        }
+        
+        # All indexers in one scan; group i matches self._indexer_titles[i].
+        # No known name overlaps another as whole words, so every mention
+        # matches exactly one alternative and the scan's per-indexer counts
+        # equal the _mention_patterns counts.
+        self._combined_pattern = re.compile(
+            r'\b(?:' + '|'.join('(' + re.escape(indexer) + ')' for indexer in indexers) + r')\b',
+            re.IGNORECASE
+        )
+        
         self.suspicious_patterns = [
             re.compile(p, re.IGNORECASE) for p in self.SUSPICIOUS_PHRASINGS
         ]
         self.legitimate_patterns = [
             re.compile(p, re.IGNORECASE) for p in self.LEGITIMATE_PHRASINGS
         ]
+        self.future_patterns = [
+            re.compile(p, re.IGNORECASE) for p in self.FUTURE_PHRASINGS
+        ]
+        self._context_scores = LRUCache(self._CONTEXT_CACHE_SIZE)
     
     def detect_claims(
         self,
@@ -104,12 +157,14 @@ class IndexingClaimDetector:
         """
         claims = []
         
-        # Find all indexer mentions
-        for indexer in self.all_indexers:
-            # Search for indexer name (case-insensitive)
-            pattern = re.compile(r'\b' + re.escape(indexer) + r'\b', re.IGNORECASE)
-            
-            for match in pattern.finditer(text):
+        # Find all indexer mentions in one pass, grouped by indexer so
+        # claims are reported indexer by indexer
+        mentions = [[] for _ in self._indexer_titles]
+        for match in self._combined_pattern.finditer(text):
+            mentions[match.lastindex - 1].append(match)
+        
+        for indexer_name, indexer_mentions in zip(self._indexer_titles, mentions):
+            for match in indexer_mentions:
                 # Extract context (100 chars before and after)
                 start = max(0, match.start() - 100)
                 end = min(len(text), match.end() + 100)
@@ -117,39 +172,59 @@ class IndexingClaimDetector:
                 
                 # Analyze the claim
                 claim = self._analyze_claim(
-                    indexer_name=indexer.title(),
+                    indexer_name=indexer_name,
                     claim_text=context,
                     source=source,
-                    full_text=text
+                    full_text=text,
+                    mention_count=len(indexer_mentions)
                 )
                 
                 claims.append(claim)
         
         return claims
     
+    def detect_claims_batch(
+        self,
+        texts: List[str],
+        source: str = "unknown",
+        n_jobs: Optional[int] = None
+    ) -> List[List[IndexingClaim]]:
+        """
+        Detect indexing claims in many texts.
+        
+        Texts are analyzed independently, so large corpora can be spread
+        over worker processes. Results are returned in input order.
+        
+        Args:
+            texts: Texts to analyze
+            source: Source of the texts ("cfp", "website", "email")
+            n_jobs: Optional worker process count; batches run serially
+                unless more than one worker is requested
+            
+        Returns:
+            List of detected claims for each text
+        """
+        return parallel_map(self.detect_claims, texts, source, n_jobs=n_jobs)
+    
     def _analyze_claim(
         self,
         indexer_name: str,
         claim_text: str,
         source: str,
-        full_text: str
+        full_text: str,
+        mention_count: Optional[int] = None
     ) -> IndexingClaim:
         """
         Analyze a single indexing claim for credibility.
         
-        Proprietary analysis algorithm.
+        Proprietary analysis algorithm. mention_count is how often the
+        indexer is mentioned in full_text, when the caller has counted it.
         """
-        # Calculate claim confidence
-        confidence = self._calculate_claim_confidence(claim_text)
-        
-        # Calculate suspicion score
-        suspicion = self._calculate_suspicion_score(claim_text)
-        
-        # Determine veracity status
-        veracity = self._determine_veracity(claim_text, suspicion, confidence)
+        # Confidence, suspicion and veracity depend only on the context
+        confidence, suspicion, veracity = self._score_context(claim_text)
         
         # Gather verification evidence
-        evidence = self._gather_evidence(claim_text, full_text, indexer_name)
+        evidence = self._gather_evidence(claim_text, full_text, indexer_name, mention_count)
         
         return IndexingClaim(
             indexer_name=indexer_name,
@@ -161,34 +236,82 @@ class IndexingClaimDetector:
             verification_evidence=evidence
         )
     
-    def _calculate_claim_confidence(self, claim_text: str) -> float:
+    def _score_context(self, claim_text: str) -> Tuple[float, float, ClaimVeracity]:
+        """
+        Confidence, suspicion and veracity of a claim context.
+        
+        CFPs share a lot of boilerplate indexing text, so results are
+        cached on the context itself.
+        """
+        scores = self._context_scores.get(claim_text)
+        if scores is None:
+            scores = self._compute_context_scores(claim_text)
+            self._context_scores.put(claim_text, scores)
+        return scores
+    
+    def _compute_context_scores(self, claim_text: str) -> Tuple[float, float, ClaimVeracity]:
+        """Confidence, suspicion and veracity of a claim context, uncached"""
+        # Both scores read the same lowercased claim text
+        lowered = claim_text.lower()
+        
+        # Calculate claim confidence
+        confidence = self._calculate_claim_confidence(claim_text, lowered)
+        
+        # Calculate suspicion score
+        suspicion = self._calculate_suspicion_score(claim_text, lowered)
+        
+        # Determine veracity status
+        veracity = self._determine_veracity(claim_text, suspicion, confidence)
+        
+        return confidence, suspicion, veracity
+    
+    def _calculate_claim_confidence(
+        self,
+        claim_text: str,
+        lowered: Optional[str] = None
+    ) -> float:
         """
         Calculate confidence in the claim detection.
         
-        Returns score from 0.0 to 1.0
+        Returns score from 0.0 to 1.0. lowered is the lowercased claim
+        text, when the caller has it.
         """
+        if lowered is None:
+            lowered = claim_text.lower()
+        
         confidence = 0.5  # Base confidence
         
         # Look for explicit indexing language
-        indexing_words = ['indexed', 'indexing', 'abstracted', 'covered', 'included']
-        if any(word in claim_text.lower() for word in indexing_words):
+        if any(word in lowered for word in self.INDEXING_WORDS):
             confidence += 0.3
         
         # Look for supporting details
-        if re.search(r'\b\d{4}\b', claim_text):  # Year mentioned
+        if self._COMPILED['year'].search(claim_text):  # Year mentioned
             confidence += 0.1
         
-        if re.search(r'(?:issn|isbn|doi)[\s:]*[\d-]+', claim_text, re.IGNORECASE):
+        # ASCII text can only match where one of the keywords appears, so
+        # substring checks rule out most claims before the IGNORECASE regex.
+        # Other text may hold characters IGNORECASE folds onto these letters.
+        if (
+            (not claim_text.isascii()
+             or any(word in lowered for word in self._IDENTIFIER_WORDS))
+            and self._COMPILED['identifier_number'].search(claim_text)
+        ):
             confidence += 0.1
         
         return min(confidence, 1.0)
     
-    def _calculate_suspicion_score(self, claim_text: str) -> float:
+    def _calculate_suspicion_score(
+        self,
+        claim_text: str,
+        lowered: Optional[str] = None
+    ) -> float:
         """
         Calculate suspicion score for the claim phrasing.
         
         Proprietary algorithm detecting predatory patterns.
-        Returns score from 0.0 (legitimate) to 1.0 (highly suspicious)
+        Returns score from 0.0 (legitimate) to 1.0 (highly suspicious).
+        lowered is the lowercased claim text, when the caller has it.
         """
         suspicion = 0.0
         
@@ -202,20 +325,25 @@ class IndexingClaimDetector:
             if pattern.search(claim_text):
                 suspicion -= 0.2
         
+        # Only increases remain, so a saturated score is final
+        if suspicion >= 1.0:
+            return 1.0
+        
         # Check for vague language
-        vague_terms = [
-            'many databases', 'various indexers', 'several indexes',
-            'well known', 'reputed', 'leading'
-        ]
-        for term in vague_terms:
-            if term in claim_text.lower():
+        if lowered is None:
+            lowered = claim_text.lower()
+        for term in self.VAGUE_TERMS:
+            if term in lowered:
                 suspicion += 0.15
+                if suspicion >= 1.0:
+                    return 1.0
         
         # Check for future tense (indicates uncertainty)
-        future_patterns = [r'\bwill\s+be\b', r'\bplanning\s+to\b', r'\baiming\s+to\b']
-        for pattern in future_patterns:
-            if re.search(pattern, claim_text, re.IGNORECASE):
+        for pattern in self.future_patterns:
+            if pattern.search(claim_text):
                 suspicion += 0.2
+                if suspicion >= 1.0:
+                    return 1.0
         
         return max(0.0, min(suspicion, 1.0))
     
@@ -240,11 +368,11 @@ class IndexingClaimDetector:
         if confidence < 0.4:
             return ClaimVeracity.UNVERIFIED
         
-        # Check for verification indicators
-        has_id = bool(re.search(r'(?:id|identifier)[\s:]*[\w\d-]+', claim_text, re.IGNORECASE))
-        has_year = bool(re.search(r'since\s+\d{4}', claim_text, re.IGNORECASE))
-        
-        if has_id or has_year:
+        # Check for verification indicators; either one is enough
+        if (
+            self._COMPILED['id'].search(claim_text)
+            or self._COMPILED['since_year'].search(claim_text)
+        ):
             return ClaimVeracity.VERIFIED
         
         # Default to pending verification
@@ -254,34 +382,40 @@ class IndexingClaimDetector:
         self,
         claim_text: str,
         full_text: str,
-        indexer_name: str
+        indexer_name: str,
+        mention_count: Optional[int] = None
     ) -> List[str]:
-        """Gather evidence supporting or refuting the claim"""
+        """
+        Gather evidence supporting or refuting the claim.
+        
+        mention_count is how often the indexer is mentioned in full_text,
+        when the caller has counted it.
+        """
         evidence = []
         
         # Look for identifiers
-        issn_match = re.search(r'issn[\s:]*(\d{4}-\d{3}[\dxX])', claim_text, re.IGNORECASE)
+        issn_match = self._COMPILED['issn'].search(claim_text)
         if issn_match:
             evidence.append(f"ISSN mentioned: {issn_match.group(1)}")
         
         # Look for specific dates
-        year_match = re.search(r'(?:since|from)\s+(\d{4})', claim_text, re.IGNORECASE)
+        year_match = self._COMPILED['indexed_from'].search(claim_text)
         if year_match:
             evidence.append(f"Indexed since: {year_match.group(1)}")
         
         # Count mentions of indexer in full text
-        mention_count = len(re.findall(
-            r'\b' + re.escape(indexer_name) + r'\b',
-            full_text,
-            re.IGNORECASE
-        ))
+        if mention_count is None:
+            pattern = self._mention_patterns.get(indexer_name)
+            if pattern is None:
+                pattern = re.compile(r'\b' + re.escape(indexer_name) + r'\b', re.IGNORECASE)
+            mention_count = len(pattern.findall(full_text))
         if mention_count > 3:
             evidence.append(f"Mentioned {mention_count} times (possibly overstated)")
         elif mention_count == 1:
             evidence.append("Single mention (appropriate)")
         
         # Check for URLs or links
-        if re.search(r'https?://[\w.-]+', claim_text):
+        if self._COMPILED['url'].search(claim_text):
             evidence.append("Link provided for verification")
         
         return evidence
@@ -302,15 +436,10 @@ class IndexingClaimDetector:
             }
         
         # Count by veracity
-        veracity_counts = {}
-        for claim in claims:
-            status = claim.veracity_status.value
-            veracity_counts[status] = veracity_counts.get(status, 0) + 1
+        veracity_counts = Counter(claim.veracity_status.value for claim in claims)
         
         # Count by indexer
-        indexer_counts = {}
-        for claim in claims:
-            indexer_counts[claim.indexer_name] = indexer_counts.get(claim.indexer_name, 0) + 1
+        indexer_counts = Counter(claim.indexer_name for claim in claims)
         
         # Calculate ratios
         total = len(claims)
@@ -324,15 +453,15 @@ class IndexingClaimDetector:
         credibility = (1.0 - suspicious_ratio * 0.7 + verified_ratio * 0.3)
         credibility = max(0.0, min(credibility, 1.0))
         
-        # Get most claimed indexers
-        most_claimed = sorted(indexer_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        # Get most claimed indexers; ties keep first-claimed order
+        most_claimed = indexer_counts.most_common(5)
         
         return {
             'total_claims': total,
             'suspicious_ratio': suspicious_ratio,
             'verified_ratio': verified_ratio,
             'most_claimed_indexers': [name for name, count in most_claimed],
-            'indexer_counts': indexer_counts,
-            'veracity_distribution': veracity_counts,
+            'indexer_counts': dict(indexer_counts),
+            'veracity_distribution': dict(veracity_counts),
             'overall_credibility': credibility
         }
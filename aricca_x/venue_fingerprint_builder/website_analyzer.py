@@ -60,12 +60,30 @@ class WebsiteAnalyzer:
         'youtube': r'youtube\.com/(?:channel|user)/[\w-]+'
     }
     
+    # HTML patterns, compiled once rather than looked up per call
+    _COMPILED = {
+        'viewport': re.compile(r'<meta[^>]*name=["\']viewport["\']', re.IGNORECASE),
+        'media_query': re.compile(r'@media[^{]*\([^)]*(?:max-width|min-width)', re.IGNORECASE),
+        'framework': re.compile(r'bootstrap|foundation|bulma|tailwind', re.IGNORECASE),
+        'framework_lower': re.compile(r'bootstrap|foundation|bulma|tailwind'),
+        'href': re.compile(r'<a[^>]*href=["\']([^"\']+)["\']', re.IGNORECASE),
+        # An http(s) URL whose host part is plain printable ASCII, which
+        # urlparse would return unchanged as the netloc
+        'plain_netloc': re.compile(r'https?://([^\x00-\x20\x7f-\U0010ffff/?#\[\]]*)(?:[/?#]|\Z)'),
+    }
+    
     def __init__(self):
         """Initialize the website analyzer"""
         self.page_patterns = {
             page_type: [re.compile(p, re.IGNORECASE) for p in patterns]
             for page_type, patterns in self.PAGE_TYPE_PATTERNS.items()
         }
+        # One alternation per page type, so each type is a single search.
+        # A page can still belong to several types.
+        self._page_type_patterns = {
+            page_type: re.compile('|'.join(patterns), re.IGNORECASE)
+            for page_type, patterns in self.PAGE_TYPE_PATTERNS.items()
+        }
         self.social_patterns = {
             platform: re.compile(pattern, re.IGNORECASE)
             for platform, pattern in self.SOCIAL_MEDIA_PATTERNS.items()
@@ -100,8 +118,7 @@ class WebsiteAnalyzer:
         # Calculate navigation depth
         max_depth = self._calculate_navigation_depth(pages)
         
-        # Identify sections
-        sections = self._identify_sections(html_content or "", pages)
+        html = html_content or ""
         
         # Check for key pages
         has_contact = 'contact' in page_types
@@ -109,13 +126,13 @@ class WebsiteAnalyzer:
         has_submission = 'submission' in page_types
         
         # Analyze responsiveness (from HTML)
-        is_responsive = self._check_responsive_design(html_content or "")
+        is_responsive = self._check_responsive_design(html)
         
         # Count external links
-        external_links = self._count_external_links(html_content or "", domain)
+        external_links = self._count_external_links(html, domain)
         
         # Detect social media presence
-        social_media = self._detect_social_media(html_content or "")
+        social_media = self._detect_social_media(html)
         
         # Calculate credibility score
         credibility = self._calculate_website_credibility(
@@ -130,7 +147,7 @@ class WebsiteAnalyzer:
             page_count=len(pages),
             pages=pages,
             max_navigation_depth=max_depth,
-            sections=list(page_types.keys()),
+            sections=list(page_types),
             has_contact_page=has_contact,
             has_about_page=has_about,
             has_submission_page=has_submission,
@@ -147,13 +164,11 @@ class WebsiteAnalyzer:
         classified = {}
         
         for page in pages:
-            for page_type, patterns in self.page_patterns.items():
-                for pattern in patterns:
-                    if pattern.search(page):
-                        if page_type not in classified:
-                            classified[page_type] = []
-                        classified[page_type].append(page)
-                        break
+            for page_type, pattern in self._page_type_patterns.items():
+                if pattern.search(page):
+                    if page_type not in classified:
+                        classified[page_type] = []
+                    classified[page_type].append(page)
         
         return classified
     
@@ -166,42 +181,11 @@ class WebsiteAnalyzer:
         if not pages:
             return 0
         
-        max_depth = 0
-        for page in pages:
-            # Count path segments
-            parsed = urlparse(page)
-            segments = [s for s in parsed.path.split('/') if s]
-            depth = len(segments)
-            max_depth = max(max_depth, depth)
-        
-        return max_depth
-    
-    def _identify_sections(self, html_content: str, pages: List[str]) -> List[str]:
-        """Identify major sections of the website"""
-        sections = set()
-        
-        # From HTML navigation
-        nav_patterns = [
-            r'<nav[^>]*>(.*?)</nav>',
-            r'<menu[^>]*>(.*?)</menu>',
-            r'class=["\'](?:nav|menu|navigation)["\'][^>]*>(.*?)</(?:div|ul|nav)>'
-        ]
-        
-        for pattern in nav_patterns:
-            matches = re.findall(pattern, html_content, re.DOTALL | re.IGNORECASE)
-            for match in matches:
-                # Extract link text
-                links = re.findall(r'<a[^>]*>(.*?)</a>', match, re.IGNORECASE)
-                sections.update(link.strip() for link in links if link.strip())
-        
-        # From page URLs
-        for page in pages:
-            parsed = urlparse(page)
-            segments = [s for s in parsed.path.split('/') if s]
-            if segments:
-                sections.add(segments[0])
-        
-        return list(sections)
+        # Deepest path, counted in non-empty segments
+        return max(
+            len([s for s in urlparse(page).path.split('/') if s])
+            for page in pages
+        )
     
     def _check_responsive_design(self, html_content: str) -> bool:
         """
@@ -212,28 +196,22 @@ class WebsiteAnalyzer:
         if not html_content:
             return False
         
-        # Check for viewport meta tag
-        has_viewport = bool(re.search(
-            r'<meta[^>]*name=["\']viewport["\']',
-            html_content,
-            re.IGNORECASE
-        ))
+        # Any one indicator is enough, so the cheapest searches go first
         
         # Check for media queries
-        has_media_queries = bool(re.search(
-            r'@media[^{]*\([^)]*(?:max-width|min-width)',
-            html_content,
-            re.IGNORECASE
-        ))
-        
-        # Check for responsive frameworks
-        has_framework = bool(re.search(
-            r'bootstrap|foundation|bulma|tailwind',
-            html_content,
-            re.IGNORECASE
-        ))
-        
-        return has_viewport or has_media_queries or has_framework
+        if self._COMPILED['media_query'].search(html_content):
+            return True
+        
+        # Check for viewport meta tag
+        if self._COMPILED['viewport'].search(html_content):
+            return True
+        
+        # Check for responsive frameworks. On ASCII text, lowering and
+        # searching case-sensitively matches exactly what IGNORECASE would,
+        # and is several times faster than the unanchored IGNORECASE search.
+        if html_content.isascii():
+            return bool(self._COMPILED['framework_lower'].search(html_content.lower()))
+        return bool(self._COMPILED['framework'].search(html_content))
     
     def _count_external_links(self, html_content: str, domain: str) -> int:
         """Count external links in HTML content"""
@@ -241,12 +219,15 @@ class WebsiteAnalyzer:
             return 0
         
         # Extract all links
-        links = re.findall(r'<a[^>]*href=["\']([^"\']+)["\']', html_content, re.IGNORECASE)
+        links = self._COMPILED['href'].findall(html_content)
         
+        plain_netloc = self._COMPILED['plain_netloc']
         external_count = 0
         for link in links:
             if link.startswith('http'):
-                link_domain = urlparse(link).netloc
+                # Most links need no urlparse to find their host
+                plain = plain_netloc.match(link)
+                link_domain = plain.group(1) if plain else urlparse(link).netloc
                 if link_domain and link_domain != domain:
                     external_count += 1
         